@@ -16,7 +16,16 @@ __copyright__ = "Copyright 2025 Omkaar"
 __version__ = "1.2.2"
 
 
+from .cache import *
+from .capture import *
+from .catalogue import *
 from .client import *
 from .endpoints import *
 from .exceptions import *
+from .history import *
+from .leaderboard import *
 from .models import *
+from .ratelimit import *
+from .sharding import *
+from .state import *
+from .transport import *
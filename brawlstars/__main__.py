@@ -0,0 +1,199 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from csv import DictWriter
+from itertools import islice
+from json import dumps
+from os import environ, replace, truncate
+from os.path import exists
+from time import monotonic, sleep
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from requests import RequestException
+
+from .client import Client
+from .exceptions import BrawlStarsException, MaintenanceError, RateLimitError, UnknownError
+from .ratelimit import RateLimiter
+
+
+_FIELDS = {
+    "rankings": ["board", "rank", "tag", "name", "trophies", "club", "error"],
+    "club-rankings": ["board", "rank", "tag", "name", "trophies", "memberCount", "error"],
+}
+
+
+def _lookup(client: Client, kind: str) -> Callable[[str], List[dict]]:
+    # Every kind maps an input line to the rows written for it.
+    if kind == "players":
+        return lambda tag: [{"tag": tag, "data": client.get_player(tag).raw()}]
+    if kind == "clubs":
+        return lambda tag: [{"tag": tag, "data": client.get_club(tag).raw()}]
+    if kind == "battlelogs":
+        return lambda tag: [{"tag": tag, "data": client.get_player_battlelog(tag).raw()}]
+    if kind == "members":
+        return lambda tag: [{"tag": tag, "data": [member.raw() for member in client.iter_club_members(tag)]}]
+
+    def rankings(line: str) -> List[dict]:
+        country, _, brawler_id = line.partition(" ")
+        if kind == "club-rankings":
+            items = client.iter_club_rankings(country)
+        elif brawler_id:
+            items = client.iter_brawler_rankings(country, int(brawler_id))
+        else:
+            items = client.iter_player_rankings(country)
+        return [dict(item.raw(), board = line) for item in items]
+
+    return rankings
+
+
+def _attempt(function: Callable[[str], List[dict]], line: str, retries: int, field: str) -> List[dict]:
+    # Failed lines become a row holding the line under ``field`` and the name
+    # of the error. Connection errors are retried like throttling.
+    line = line.strip()
+    for attempt in range(retries + 1 if line else 0):
+        try:
+            return function(line)
+        except (MaintenanceError, RateLimitError, UnknownError, RequestException) as error:
+            if attempt == retries:
+                return [{field: line, "error": type(error).__name__}]
+            sleep(2 ** attempt)
+        except (BrawlStarsException, ValueError) as error:
+            return [{field: line, "error": type(error).__name__}]
+    return []
+
+
+def _results(function: Callable[[str], List[dict]], lines: Iterable[str], concurrency: int, retries: int, field: str) -> Iterator[List[dict]]:
+    # Lines are fetched concurrently, but their results are yielded in input
+    # order, with at most ``concurrency * 2`` of them held in memory.
+    lines = iter(lines)
+    with ThreadPoolExecutor(concurrency) as executor:
+        pending = deque(executor.submit(_attempt, function, line, retries, field) for line in islice(lines, concurrency * 2))
+        while pending:
+            result = pending.popleft().result()
+            for line in islice(lines, 1):
+                pending.append(executor.submit(_attempt, function, line, retries, field))
+            yield result
+
+
+def _export(client: Client, kind: str, lines: Iterable[str], output: TextIO, *, output_format: str = "ndjson", header: bool = True, concurrency: int = 8, retries: int = 3, on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+    # Returns the number of input lines handled, calling
+    # ``on_progress(lines, errors)`` after writing the rows of each of them.
+    writer = None
+    if output_format == "csv":
+        writer = DictWriter(output, _FIELDS.get(kind, ["tag", "error"]), extrasaction = "ignore")
+        if header:
+            writer.writeheader()
+    count = errors = 0
+    for rows in _results(_lookup(client, kind), lines, concurrency, retries, "board" if kind in _FIELDS else "tag"):
+        for row in rows:
+            if writer:
+                writer.writerow({key: value.get("name") if isinstance(value, dict) else value for key, value in row.items()})
+            else:
+                output.write(dumps(row, separators = (",", ":"), ensure_ascii = False) + "\n")
+        count += 1
+        errors += any("error" in row for row in rows)
+        if on_progress:
+            on_progress(count, errors)
+    return count
+
+
+def _parser() -> ArgumentParser:
+    parser = ArgumentParser(prog = "python -m brawlstars", description = "Exports players, clubs, battlelogs, club members or rankings for a list of tags.")
+    parser.add_argument("kind", choices = ["players", "clubs", "battlelogs", "members", "rankings", "club-rankings"], help = "what to export. For rankings, every input line is a country code or 'global', optionally followed by a brawler ID.")
+    parser.add_argument("input", nargs = "?", default = "-", help = "the file to read tags from, one per line, or '-' for stdin.")
+    parser.add_argument("-o", "--output", default = "-", help = "the file to write to, or '-' for stdout.")
+    parser.add_argument("-f", "--format", choices = ["ndjson", "csv"], default = "ndjson", dest = "output_format", help = "the output format. CSV is only available for rankings.")
+    parser.add_argument("-t", "--token", default = environ.get("BRAWLSTARS_TOKEN"), help = "the API token, defaults to the BRAWLSTARS_TOKEN environment variable.")
+    parser.add_argument("-c", "--concurrency", type = int, default = 8, help = "the number of requests sent at once.")
+    parser.add_argument("-r", "--rate", type = float, default = 10, help = "the maximum number of requests per second.")
+    parser.add_argument("--retries", type = int, default = 3, help = "the number of retries on throttling, maintenance, unknown or connection errors.")
+    parser.add_argument("--checkpoint", help = "the file that progress is saved to, so that an interrupted export can be resumed.")
+    parser.add_argument("--progress", action = "store_true", help = "report progress on stderr.")
+    return parser
+
+
+def _read_checkpoint(path: Optional[str]) -> Tuple[int, Optional[int]]:
+    # Checkpoints hold the number of input lines handled and, when writing to
+    # a file, the size of the output at that point.
+    if not path or not exists(path):
+        return 0, None
+    with open(path, encoding = "utf-8") as file:
+        count, _, offset = file.read().strip().partition(" ")
+    return int(count or 0), int(offset) if offset else None
+
+
+def _write_checkpoint(path: str, count: int, output: TextIO) -> None:
+    output.flush()
+    offset = f" {output.tell()}" if output.seekable() else ""
+    with open(f"{path}.tmp", "w", encoding = "utf-8") as file:
+        file.write(f"{count}{offset}")
+    replace(f"{path}.tmp", path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments: Namespace = _parser().parse_args(argv)
+    if not arguments.token:
+        _parser().error("an API token is required, pass --token or set BRAWLSTARS_TOKEN.")
+    if arguments.output_format == "csv" and arguments.kind not in _FIELDS:
+        _parser().error("CSV output is only available for rankings.")
+    skipped, offset = _read_checkpoint(arguments.checkpoint)
+    started = last = monotonic()
+
+    def progress(count: int, errors: int) -> None:
+        nonlocal last
+        now = monotonic()
+        if now - last < 1:
+            return
+        last = now
+        if arguments.checkpoint:
+            _write_checkpoint(arguments.checkpoint, skipped + count, output)
+        if arguments.progress:
+            sys.stderr.write(f"\r{skipped + count} done, {errors} errors, {count / (now - started):.1f}/s")
+
+    with ExitStack() as stack:
+        client = Client(arguments.token, rate_limiter = RateLimiter(arguments.rate), pool_size = arguments.concurrency)
+        stack.callback(client.close)
+        source = sys.stdin if arguments.input == "-" else stack.enter_context(open(arguments.input, encoding = "utf-8"))
+        if skipped and offset is not None and arguments.output != "-":
+            # Rows written after the checkpoint was saved are written again.
+            truncate(arguments.output, offset)
+        output = sys.stdout if arguments.output == "-" else stack.enter_context(open(arguments.output, "a" if skipped else "w", encoding = "utf-8", newline = ""))
+        count = _export(client, arguments.kind, islice(source, skipped, None), output, output_format = arguments.output_format, header = not skipped, concurrency = arguments.concurrency, retries = arguments.retries, on_progress = progress)
+        if arguments.checkpoint:
+            _write_checkpoint(arguments.checkpoint, skipped + count, output)
+        output.flush()
+    if arguments.progress:
+        sys.stderr.write(f"\r{skipped + count} done.\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock, Thread
+from time import time
+from typing import Callable, Hashable, Optional, Union
+
+from .exceptions import MaintenanceError, RateLimitError, TransportError, UnknownError
+
+
+class CachedDict(dict):
+
+    """
+    A class that represents a JSON object served by a :class:`Cache`.
+    """
+
+    fetched_at = None
+
+
+class CachedList(list):
+
+    """
+    A class that represents a JSON array served by a :class:`Cache`.
+    """
+
+    fetched_at = None
+
+
+def _stamp(payload: Union[dict, list], fetched_at: float) -> Union[CachedDict, CachedList]:
+    payload = CachedDict(payload) if isinstance(payload, dict) else CachedList(payload)
+    payload.fetched_at = fetched_at
+    return payload
+
+
+class Cache:
+
+    """
+    A class that represents a stale-while-revalidate cache for API responses.
+
+    Responses younger than ``ttl`` are served as they are. Responses younger than ``ttl + grace`` are served immediately while a single background request refreshes them. Older responses are fetched again, but are still served if the API fails because of maintenance, throttling or an unknown error.
+
+    :param ttl: The time for which a response is considered fresh, in seconds.
+    :type ttl: Optional[:class:`float`]
+    :param grace: The time after ``ttl`` for which a stale response is served while it is refreshed, in seconds.
+    :type grace: Optional[:class:`float`]
+    :param max_size: The maximum number of responses kept.
+    :type max_size: Optional[:class:`int`]
+
+    .. note::
+
+        Cached responses are shared, so they must not be modified.
+    """
+
+    def __init__(self, ttl: Optional[float] = 60, *, grace: Optional[float] = 300, max_size: Optional[int] = 1024) -> None:
+        self.ttl = ttl
+        self.grace = grace
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = Lock()
+
+    def _store(self, key: Hashable, payload: Union[dict, list]) -> Union[CachedDict, CachedList]:
+        payload = _stamp(payload, time())
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+        return payload
+
+    def _refresh(self, key: Hashable, load: Callable[[], Union[dict, list]]) -> None:
+        try:
+            self._store(key, load())
+        except (MaintenanceError, RateLimitError, UnknownError, TransportError):
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, key: Hashable, load: Callable[[], Union[dict, list]]) -> Union[CachedDict, CachedList]:
+        """
+        Gets a response from the cache, calling ``load`` to fetch it when needed.
+
+        :param key: The key of the response.
+        :type key: Hashable
+        :param load: The function that fetches the response.
+        :type load: Callable
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+        if payload is not None:
+            age = time() - payload.fetched_at
+            if age < self.ttl:
+                return payload
+            if age < self.ttl + self.grace:
+                with self._lock:
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        Thread(target = self._refresh, args = (key, load), daemon = True).start()
+                return payload
+        try:
+            return self._store(key, load())
+        except (MaintenanceError, RateLimitError, UnknownError, TransportError):
+            if payload is None:
+                raise
+            return payload
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Removes a response from the cache, or every response if no key is given.
+
+        :param key: The key of the response.
+        :type key: Optional[Hashable]
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -0,0 +1,291 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from gzip import open as open_gzip
+from json import dumps as dump_json, loads as load_json
+from re import compile as compile_regex
+from struct import pack, unpack
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Iterator, Optional, Union, TYPE_CHECKING
+from urllib.parse import unquote
+
+from . import serialization
+from .endpoints import BASE_URL
+from .models import Battlelog, BrawlStarsObject, ClubMemberList, EventList, Player, _battle, _coloured
+from .transport import RequestsTransport, Transport
+from .utils import _fetch, _iter_items, _request
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+def _key(url: str, params: Optional[dict]) -> tuple:
+    return url, tuple(sorted((key, value) for key, value in (params or {}).items() if value is not None))
+
+
+def read_capture(path: str) -> Iterator[dict]:
+    """
+    Reads the records of a capture file, in the order they were written.
+
+    Every record has the time it was sent at relative to the start of the capture (``t``), the ``url``, the ``params``, the ``status`` code, the time it took (``elapsed``) and the body, as ``json`` or raw ``body`` bytes.
+
+    :param path: The path of the capture file.
+    :type path: :class:`str`
+
+    .. note::
+
+        Captures appended to an existing file start a new session, whose times carry on from the end of the previous one.
+    """
+    offset = end = 0.0
+    with open_gzip(path, "rb") as file:
+        while True:
+            header = file.read(4)
+            if len(header) < 4:
+                return
+            record = serialization.loads(file.read(unpack(">I", header)[0]))
+            if "session" in record:
+                offset = end
+                continue
+            record["t"] += offset
+            end = max(end, record["t"] + record["elapsed"])
+            yield record
+
+
+class _CapturedResponse:
+
+    def __init__(self, write: Callable[[dict], None], response, record: dict) -> None:
+        self._write = write
+        self._response = response
+        self._record = record
+        self._chunks = []
+        # Error responses are written as soon as they are received.
+        self._written = response.status_code >= 400
+        self.status_code = response.status_code
+
+    def _finish(self) -> None:
+        if not self._written:
+            self._written = True
+            self._write(self._record)
+
+    def json(self) -> Union[dict, list]:
+        data = self._response.json()
+        if not self._written:
+            self._record["json"] = data
+            self._finish()
+        return data
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        for chunk in self._response.iter_content(chunk_size = chunk_size):
+            self._chunks.append(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._response.close()
+        if not self._written:
+            self._record["body"] = b"".join(self._chunks)
+            self._finish()
+
+
+class CaptureTransport(Transport):
+
+    """
+    A class that represents a transport recording every request and response to a capture file, to be replayed later with :class:`ReplayTransport`.
+
+    Records are MessagePack encoded and gzip compressed, and hold no headers, so the API token is never written.
+
+    :param path: The path of the capture file, which is appended to as a new session if it exists.
+    :type path: :class:`str`
+    :param transport: The transport that requests are sent with, defaults to a :class:`RequestsTransport`.
+    :type transport: Optional[:class:`Transport`]
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None) -> None:
+        self.path = path
+        self.transport = transport if transport else RequestsTransport()
+        self._file = open_gzip(path, "ab")
+        self._lock = Lock()
+        self._started = monotonic()
+        # Times restart at zero, so every transport marks where its session
+        # starts for them to be told apart from those already in the file.
+        self._write({"session": True})
+
+    def _write(self, record: dict) -> None:
+        data = serialization.dumps(record)
+        with self._lock:
+            self._file.write(pack(">I", len(data)) + data)
+
+    def get(self, url: str, *, headers: dict, params: Optional[dict] = None, stream: Optional[bool] = False):
+        started = monotonic()
+        response = self.transport.get(url, headers = headers, params = params, stream = stream)
+        record = {"t": started - self._started, "url": url, "params": dict(_key(url, params)[1]), "stream": bool(stream), "status": response.status_code, "elapsed": monotonic() - started}
+        if response.status_code >= 400:
+            self._write(record)
+        return _CapturedResponse(self._write, response, record)
+
+    def close(self) -> None:
+        self.transport.close()
+        with self._lock:
+            self._file.close()
+
+
+class _ReplayedResponse:
+
+    def __init__(self, record: dict) -> None:
+        self._record = record
+        self.status_code = record["status"]
+
+    def json(self) -> Union[dict, list]:
+        if "json" in self._record:
+            return self._record["json"]
+        return load_json(self._record.get("body", b"{}"))
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        body = self._record["body"] if "body" in self._record else dump_json(self._record.get("json", {})).encode()
+        chunk_size = chunk_size if chunk_size else len(body) or 1
+        for index in range(0, len(body), chunk_size):
+            yield body[index:index + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayTransport(Transport):
+
+    """
+    A class that represents a transport serving the responses of a capture file instead of sending requests.
+
+    Responses to the same request are served in the order they were recorded, starting over once all of them were served. Requests that were never recorded get a 404 response.
+
+    :param path: The path of the capture file.
+    :type path: :class:`str`
+    :param speed: How many times faster than recorded responses are served, or ``None`` to serve them without delay.
+    :type speed: Optional[:class:`float`]
+    """
+
+    def __init__(self, path: str, *, speed: Optional[float] = 1.0) -> None:
+        self.speed = speed
+        self._records = defaultdict(deque)
+        self._lock = Lock()
+        for record in read_capture(path):
+            self._records[_key(record["url"], record["params"])].append(record)
+
+    def get(self, url: str, *, headers: dict, params: Optional[dict] = None, stream: Optional[bool] = False):
+        with self._lock:
+            records = self._records.get(_key(url, params))
+            if not records:
+                return _ReplayedResponse({"status": 404})
+            record = records.popleft()
+            records.append(record)
+        if self.speed:
+            sleep(record["elapsed"] / self.speed)
+        return _ReplayedResponse(record)
+
+
+def _club(data: dict) -> BrawlStarsObject:
+    club = BrawlStarsObject(data)
+    club.members = list(ClubMemberList({"items": data.get("members", [])}))
+    return club
+
+
+# Every route maps the path of a request to the model built from its JSON
+# response, and to the converter of every item when it was streamed.
+_ROUTES = [
+    (compile_regex(r"players/[^/]+/battlelog"), lambda data: list(Battlelog(data)), _battle),
+    (compile_regex(r"players/[^/]+"), Player, None),
+    (compile_regex(r"clubs/[^/]+/members"), lambda data: list(ClubMemberList(data)), _coloured),
+    (compile_regex(r"clubs/[^/]+"), _club, None),
+    (compile_regex(r"rankings/[^/]+/(players|brawlers/[^/]+)"), lambda data: [_coloured(item) for item in data["items"]], _coloured),
+    (compile_regex(r"rankings/[^/]+/clubs"), lambda data: [BrawlStarsObject(item) for item in data["items"]], BrawlStarsObject),
+    (compile_regex(r"brawlers"), lambda data: [BrawlStarsObject(item) for item in data["items"]], BrawlStarsObject),
+    (compile_regex(r"brawlers/[^/]+"), BrawlStarsObject, None),
+    (compile_regex(r"events/rotation"), lambda data: list(EventList(data)), None),
+]
+
+
+def _build(client: Client, record: dict) -> None:
+    url = unquote(record["url"].split("://", 1)[-1])
+    path = url.split(BASE_URL, 1)[-1]
+    build, item = next(((build, item) for pattern, build, item in _ROUTES if pattern.fullmatch(path)), (None, None))
+    if item and record.get("stream", "body" in record):
+        response = _request(url, client, record["params"], stream = True)
+        try:
+            for data in _iter_items(response.iter_content(chunk_size = 16384), {}):
+                item(data)
+        finally:
+            response.close()
+        return
+    data = _fetch(url, client, record["params"])
+    if build:
+        build(data)
+
+
+def replay(client: Client, path: str, *, speed: Optional[float] = 1.0, concurrency: Optional[int] = 32) -> dict:
+    """
+    Sends the requests of a capture file through a client, at the times they were recorded at, and builds the models of their responses.
+
+    Combined with a :class:`ReplayTransport`, this reproduces the recorded traffic through the whole client without using the API.
+
+    :param client: The client to send the requests with.
+    :type client: :class:`Client`
+    :param path: The path of the capture file.
+    :type path: :class:`str`
+    :param speed: How many times faster than recorded requests are sent, or ``None`` to send them as fast as possible.
+    :type speed: Optional[:class:`float`]
+    :param concurrency: The maximum number of requests sent at once.
+    :type concurrency: Optional[:class:`int`]
+
+    .. note::
+
+        Returns a dictionary with the number of ``requests`` sent, the number of ``errors`` raised of each type and the ``duration`` of the replay in seconds.
+    """
+    errors = Counter()
+    lock = Lock()
+
+    def send(record: dict) -> None:
+        try:
+            _build(client, record)
+        except Exception as error: # pylint: disable=broad-except
+            with lock:
+                errors[type(error).__name__] += 1
+
+    # At most ``concurrency * 2`` requests are held at once, so that large
+    # captures are not read into memory ahead of the requests being sent.
+    started = monotonic()
+    count = 0
+    pending = deque()
+    with ThreadPoolExecutor(concurrency) as executor:
+        for record in read_capture(path):
+            if len(pending) >= (concurrency or 32) * 2:
+                pending.popleft().result()
+            if speed:
+                sleep(max(0.0, started + record["t"] / speed - monotonic()))
+            pending.append(executor.submit(send, record))
+            count += 1
+    return {"requests": count, "errors": dict(errors), "duration": monotonic() - started}
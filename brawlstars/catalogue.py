@@ -0,0 +1,195 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from threading import Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
+
+from .models import Battlelog, BrawlStarsObject, Player
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+class Catalogue:
+
+    """
+    A class that represents the static game data, indexed for constant time lookups.
+
+    The data is loaded from :meth:`Client.get_brawlers` on first use and refreshed in the background once it is older than ``refresh_interval``. A catalogue can be shared by any number of clients and threads.
+
+    :param client: The client used to load the game data.
+    :type client: :class:`Client`
+    :param refresh_interval: The time after which the game data is refreshed, in seconds.
+    :type refresh_interval: Optional[:class:`float`]
+    """
+
+    def __init__(self, client: Client, *, refresh_interval: Optional[float] = 3600) -> None:
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self._indexes = None
+        self._loaded = 0.0
+        self._lock = Lock()
+        self._refreshing = False
+
+    def load(self) -> None:
+        """
+        Loads the game data and rebuilds every index.
+        """
+        brawlers = self.client.get_brawlers()
+        indexes = {"brawlers": {}, "names": {}, "gadgets": {}, "star_powers": {}, "gears": {}}
+        for brawler in brawlers:
+            indexes["brawlers"][brawler.id] = brawler
+            indexes["names"][brawler.name.casefold()] = brawler
+            for gadget in getattr(brawler, "gadgets", []):
+                indexes["gadgets"][gadget.id] = brawler
+            for star_power in getattr(brawler, "star_powers", []):
+                indexes["star_powers"][star_power.id] = brawler
+            for gear in getattr(brawler, "gears", []):
+                indexes["gears"][gear.id] = gear
+        self._indexes = indexes
+        self._loaded = monotonic()
+
+    def _refresh(self) -> None:
+        try:
+            self.load()
+        finally:
+            self._refreshing = False
+
+    def _index(self, name: str) -> Dict:
+        if self._indexes is None:
+            with self._lock:
+                if self._indexes is None:
+                    self.load()
+        elif monotonic() - self._loaded >= self.refresh_interval and not self._refreshing:
+            with self._lock:
+                if not self._refreshing:
+                    self._refreshing = True
+                    Thread(target = self._refresh, daemon = True).start()
+        return self._indexes[name]
+
+    @property
+    def brawlers(self) -> List[BrawlStarsObject]:
+        """
+        Every brawler in the game.
+        """
+        return list(self._index("brawlers").values())
+
+    def get_brawler(self, brawler: Union[int, str]) -> Optional[BrawlStarsObject]:
+        """
+        Gets a brawler by its ID or its case-insensitive name.
+
+        :param brawler: The ID or the name of the brawler.
+        :type brawler: Union[:class:`int`, :class:`str`]
+        """
+        if isinstance(brawler, str) and not brawler.isdigit():
+            return self._index("names").get(brawler.casefold())
+        return self._index("brawlers").get(int(brawler))
+
+    def get_brawler_id(self, name: str) -> Optional[int]:
+        """
+        Gets the ID of a brawler from its case-insensitive name.
+
+        :param name: The name of the brawler.
+        :type name: :class:`str`
+        """
+        brawler = self._index("names").get(name.casefold())
+        return brawler.id if brawler else None
+
+    def get_brawler_name(self, brawler_id: int) -> Optional[str]:
+        """
+        Gets the name of a brawler from its ID.
+
+        :param brawler_id: The ID of the brawler.
+        :type brawler_id: :class:`int`
+        """
+        brawler = self._index("brawlers").get(int(brawler_id))
+        return brawler.name if brawler else None
+
+    def get_gadget_brawler(self, gadget_id: int) -> Optional[BrawlStarsObject]:
+        """
+        Gets the brawler a gadget belongs to.
+
+        :param gadget_id: The ID of the gadget.
+        :type gadget_id: :class:`int`
+        """
+        return self._index("gadgets").get(int(gadget_id))
+
+    def get_star_power_brawler(self, star_power_id: int) -> Optional[BrawlStarsObject]:
+        """
+        Gets the brawler a star power belongs to.
+
+        :param star_power_id: The ID of the star power.
+        :type star_power_id: :class:`int`
+        """
+        return self._index("star_powers").get(int(star_power_id))
+
+    def get_gear(self, gear_id: int) -> Optional[BrawlStarsObject]:
+        """
+        Gets a gear by its ID.
+
+        :param gear_id: The ID of the gear.
+        :type gear_id: :class:`int`
+        """
+        return self._index("gears").get(int(gear_id))
+
+    def _enrich(self, item: Union[BrawlStarsObject, list]) -> None:
+        if isinstance(item, list):
+            for element in item:
+                if isinstance(element, (BrawlStarsObject, list)):
+                    self._enrich(element)
+            return
+        for key, value in vars(item).items():
+            if key.startswith("_"):
+                continue
+            if key == "brawler" and isinstance(value, BrawlStarsObject):
+                value.info = self._index("brawlers").get(getattr(value, "id", None))
+            elif key == "brawlers" and isinstance(value, list):
+                for brawler in value:
+                    if isinstance(brawler, BrawlStarsObject):
+                        brawler.info = self._index("brawlers").get(getattr(brawler, "id", None))
+                        self._enrich(brawler)
+            elif key != "info" and isinstance(value, (BrawlStarsObject, list)):
+                self._enrich(value)
+
+    def enrich(self, item: Union[Player, Battlelog, BrawlStarsObject, list]) -> Union[Player, BrawlStarsObject, list]:
+        """
+        Attaches the catalogue entry of every brawler found in a model as its ``info`` attribute.
+
+        No request is sent, apart from loading the catalogue the first time it is used.
+
+        :param item: The model to enrich.
+        :type item: Union[:class:`Player`, :class:`Battlelog`, :class:`BrawlStarsObject`, :class:`list`]
+
+        .. note::
+
+            A :class:`Battlelog` is returned as a list of battles.
+        """
+        if isinstance(item, Battlelog):
+            item = list(item)
+        self._enrich(item)
+        return item
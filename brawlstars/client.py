@@ -25,32 +25,115 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from time import sleep
-from typing import Callable, Optional, List
-from threading import Thread
+from contextlib import contextmanager
+from time import sleep, time
+from typing import Callable, Iterator, Optional, List, Tuple, Union
+from threading import Lock, Thread, Timer, local
 
 from requests import Session
 
+from .cache import Cache
 from .endpoints import BASE_URL
-from .exceptions import UncallableError
-from .models import Battlelog, BrawlStarsObject, ClubMemberList, EventList, Player, PlayerRanking, ClubRanking
-from .utils import _fetch, _difference
+from .exceptions import BrawlStarsException, UncallableError
+from .models import Battlelog, BrawlStarsObject, ClubMemberList, EventList, Player, PlayerRanking, ClubRanking, _battle, _coloured
+from .ratelimit import Priority, RateLimiter
+from .sharding import Shard
+from .state import StateStore
+from .transport import RequestsTransport, Transport
+from .utils import _fetch, _iter_items, _request, _rotation_expiry
 
 
-class Client:
+_ROTATION_RETRY = 10
+_ROTATION_KEY = "event_rotation"
+
+
+class Client: # pylint: disable=too-many-instance-attributes, too-many-public-methods
 
     """
     A class that represents a client.
 
     :param token: The Brawl Stars API token.
     :type token: :class:`str`
-    :param session: The session to use.
+    :param session: The session to use, shared by every thread.
     :type session: Optional[:class:`requests.Session`]
+    :param rate_limiter: The rate limiter that every request waits on before being sent.
+    :type rate_limiter: Optional[:class:`RateLimiter`]
+    :param pool_size: The maximum number of connections kept open to the API.
+    :type pool_size: Optional[:class:`int`]
+    :param cache: The cache that responses are served from.
+    :type cache: Optional[:class:`Cache`]
+    :param store: The store that the state of event watchers is saved to, so that changes made while the program is not running are still detected.
+    :type store: Optional[:class:`StateStore`]
+    :param transport: The transport used to send requests, defaults to a :class:`RequestsTransport` using ``session`` and ``pool_size``.
+    :type transport: Optional[:class:`Transport`]
+    :param shard: The shard that event watchers are split with, so that every watcher is only polled by the node it is assigned to.
+    :type shard: Optional[:class:`Shard`]
+
+    .. note::
+
+        Clients are thread-safe. With the default transport, every thread gets its own session unless a ``session`` is provided, and all of them share one connection pool.
     """
 
-    def __init__(self, token: str, *, session: Optional[Session] = None) -> None:
-        self.session = session if session else Session()
-        self.session.headers = {"Authorization": f"Bearer {token}"}
+    def __init__(self, token: str, *, session: Optional[Session] = None, rate_limiter: Optional[RateLimiter] = None, pool_size: Optional[int] = 10, cache: Optional[Cache] = None, store: Optional[StateStore] = None, transport: Optional[Transport] = None, shard: Optional[Shard] = None) -> None:
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.store = store
+        self.shard = shard
+        if session and transport:
+            raise ValueError("a session cannot be used with a custom transport, pass it to the transport instead.")
+        self.transport = transport if transport else RequestsTransport(session = session, headers = self.headers, pool_size = pool_size)
+        self._local = local()
+        self._rotation = None
+        self._rotation_lock = Lock()
+
+    @property
+    def session(self) -> Session:
+        """
+        The session used by the current thread, if the client uses a :class:`RequestsTransport`.
+        """
+        return self._requests_transport().session
+
+    @session.setter
+    def session(self, session: Session) -> None:
+        self._requests_transport().session = session
+
+    def _requests_transport(self) -> RequestsTransport:
+        if not isinstance(self.transport, RequestsTransport):
+            raise TypeError(f"sessions are only used by RequestsTransport, not {type(self.transport).__name__}.")
+        return self.transport
+
+    def close(self) -> None:
+        """
+        Closes every connection opened by the client.
+        """
+        self.transport.close()
+
+    @property
+    def current_priority(self) -> Priority:
+        """
+        The priority lane used for requests sent from the current thread.
+        """
+        return getattr(self._local, "priority", Priority.NORMAL)
+
+    @contextmanager
+    def priority(self, priority: Union[Priority, int]) -> Iterator[None]:
+        """
+        Sends every request made from the current thread inside the ``with`` block in the given lane.
+
+        :param priority: The lane to send requests in.
+        :type priority: :class:`Priority`
+
+        .. note::
+
+            Lanes only have an effect if the client has a ``rate_limiter``.
+        """
+        previous = self.current_priority
+        self._local.priority = Priority(priority)
+        try:
+            yield
+        finally:
+            self._local.priority = previous
 
     def get_player_battlelog(self, tag: str) -> Battlelog:
         """
@@ -107,7 +190,7 @@ class Client:
         """
         data = _fetch(f"{BASE_URL}clubs/{tag}", self)
         club = BrawlStarsObject(data)
-        club.members = ClubMemberList(data.pop("members", []))
+        club.members = ClubMemberList({"items": data.get("members", [])})
         return club
 
     def get_player_rankings(self, country: str, *, before: Optional[str] = None, after: Optional[str] = None, limit: Optional[int] = None) -> PlayerRanking:
@@ -208,12 +291,170 @@ class Client:
         data = _fetch(f"{BASE_URL}brawlers/{brawler_id}", self)
         return BrawlStarsObject(data)
 
+    def _paginate(self, url: str, item: Callable, limit: Optional[int], page_size: Optional[int]) -> Iterator[BrawlStarsObject]:
+        count = 0
+        after = None
+        while True:
+            size = page_size
+            if limit is not None:
+                size = min(limit - count, page_size) if page_size else limit - count
+            response = _request(url, self, {"after": after, "limit": size}, stream = True)
+            rest = {}
+            try:
+                for data in _iter_items(response.iter_content(chunk_size = 16384), rest):
+                    if limit is not None and count >= limit:
+                        return
+                    yield item(data)
+                    count += 1
+            finally:
+                response.close()
+            after = rest.get("paging", {}).get("cursors", {}).get("after")
+            if not after or (limit is not None and count >= limit):
+                return
+
+    def iter_club_members(self, tag: str, *, limit: Optional[int] = None, page_size: Optional[int] = None) -> Iterator[BrawlStarsObject]:
+        """
+        Iterates over the members of a club, following pages until ``limit`` is reached.
+
+        :param tag: The tag of the club.
+        :type tag: :class:`str`
+        :param limit: The maximum number of items to be returned.
+        :type limit: Optional[:class:`int`]
+        :param page_size: The maximum number of items to be requested at once.
+        :type page_size: Optional[:class:`int`]
+
+        .. note::
+
+            Responses are parsed as they are received, so every member is returned as soon as it arrives.
+        """
+        return self._paginate(f"{BASE_URL}clubs/{tag}/members", _coloured, limit, page_size)
+
+    def iter_player_rankings(self, country: str, *, limit: Optional[int] = None, page_size: Optional[int] = None) -> Iterator[BrawlStarsObject]:
+        """
+        Iterates over global player rankings or those for a specific country, following pages until ``limit`` is reached.
+
+        :param country: The two-letter country code, or 'global' for global rankings.
+        :type country: :class:`str`
+        :param limit: The maximum number of items to be returned.
+        :type limit: Optional[:class:`int`]
+        :param page_size: The maximum number of items to be requested at once.
+        :type page_size: Optional[:class:`int`]
+
+        .. note::
+
+            Responses are parsed as they are received, so every player is returned as soon as it arrives.
+        """
+        return self._paginate(f"{BASE_URL}rankings/{country}/players", _coloured, limit, page_size)
+
+    def iter_brawler_rankings(self, country: str, brawler_id: int, *, limit: Optional[int] = None, page_size: Optional[int] = None) -> Iterator[BrawlStarsObject]:
+        """
+        Iterates over global brawler rankings or those for a specific country, following pages until ``limit`` is reached.
+
+        :param country: The two-letter country code, or 'global' for global rankings.
+        :type country: :class:`str`
+        :param brawler_id: The ID of the brawler.
+        :type brawler_id: :class:`int`
+        :param limit: The maximum number of items to be returned.
+        :type limit: Optional[:class:`int`]
+        :param page_size: The maximum number of items to be requested at once.
+        :type page_size: Optional[:class:`int`]
+
+        .. note::
+
+            Responses are parsed as they are received, so every player is returned as soon as it arrives.
+        """
+        return self._paginate(f"{BASE_URL}rankings/{country}/brawlers/{brawler_id}", _coloured, limit, page_size)
+
+    def iter_club_rankings(self, country: str, *, limit: Optional[int] = None, page_size: Optional[int] = None) -> Iterator[BrawlStarsObject]:
+        """
+        Iterates over global club rankings or those for a specific country, following pages until ``limit`` is reached.
+
+        :param country: The two-letter country code, or 'global' for global rankings.
+        :type country: :class:`str`
+        :param limit: The maximum number of items to be returned.
+        :type limit: Optional[:class:`int`]
+        :param page_size: The maximum number of items to be requested at once.
+        :type page_size: Optional[:class:`int`]
+
+        .. note::
+
+            Responses are parsed as they are received, so every club is returned as soon as it arrives.
+        """
+        return self._paginate(f"{BASE_URL}rankings/{country}/clubs", BrawlStarsObject, limit, page_size)
+
+    def _load_rotation(self) -> Tuple[list, float]:
+        with self._rotation_lock:
+            if self._rotation is not None and self._rotation[1] > time():
+                return self._rotation
+            data = _request(f"{BASE_URL}events/rotation", self).json()
+            now = time()
+            expires = _rotation_expiry(data, now)
+            if expires is None:
+                expires = now + _ROTATION_RETRY
+            self._rotation = (data, expires)
+            timer = Timer(expires - now, self._refresh_rotation)
+            timer.daemon = True
+            timer.start()
+            return self._rotation
+
+    def _refresh_rotation(self) -> None:
+        # Only the node that owns the rotation keeps it fresh; others load it
+        # when it is next requested.
+        if self.shard and not self.shard.owns(_ROTATION_KEY):
+            return
+        try:
+            self._load_rotation()
+        except (BrawlStarsException, ValueError):
+            timer = Timer(_ROTATION_RETRY, self._refresh_rotation)
+            timer.daemon = True
+            timer.start()
+
     def get_event_rotation(self) -> EventList:
         """
         Gets the event rotation.
+
+        .. note::
+
+            The rotation is cached until the first event ends or the next one starts, and is refreshed in the background at that moment, so only one request is sent per rotation. The API only lists the events of the current slot, so the next slot cannot be fetched ahead of time, and a refresh before the boundary would return the same events. Calls made after the boundary and before the refresh finishes wait for it.
         """
-        data = _fetch(f"{BASE_URL}events/rotation", self)
-        return EventList(data)
+        rotation = self._rotation
+        if rotation is None or time() >= rotation[1]:
+            rotation = self._load_rotation()
+        return EventList(rotation[0])
+
+    def _watch(self, key: str, url: str, function: Callable, name: str, *, snapshot: Callable, changes: Callable, repeat_duration: float) -> None:
+
+        def process():
+            state = None
+            while True:
+                if self.shard and not self.shard.owns(key):
+                    state = None
+                    sleep(repeat_duration)
+                    continue
+                if state is None and self.store:
+                    state = self.store.get(key)
+                try:
+                    current = _request(url, self).json()
+                except (BrawlStarsException, ValueError):
+                    # The state is kept, so changes are still reported once
+                    # the API answers again.
+                    sleep(repeat_duration)
+                    continue
+                if state is None:
+                    state = snapshot(current)
+                    if self.store:
+                        self.store.set(key, state)
+                else:
+                    difference = changes(state, current)
+                    state = snapshot(current)
+                    if self.store:
+                        self.store.set(key, state)
+                    if len(difference) >= 1:
+                        function(**{name: difference})
+                sleep(repeat_duration)
+
+        thread = Thread(target = process)
+        thread.start()
 
     def on_member_join(self, tag: str, *, repeat_duration: Optional[float] = 60):
         """
@@ -226,17 +467,11 @@ class Client:
         """
         def decorator(function: Callable):
 
-            def process():
-                while True:
-                    cache = list(self.get_club_members(tag))
-                    sleep(repeat_duration)
-                    current = list(self.get_club_members(tag))
-                    difference = _difference(current, cache)
-                    if len(difference) >= 1:
-                        function(members = difference)
+            def changes(members: list, data: dict) -> list:
+                tags = {member["tag"] for member in members}
+                return [_coloured(member) for member in data["items"] if member["tag"] not in tags]
 
-            thread = Thread(target = process)
-            thread.start()
+            self._watch(f"member_join:{tag}", f"{BASE_URL}clubs/{tag}/members", function, "members", snapshot = lambda data: data["items"], changes = changes, repeat_duration = repeat_duration)
 
             def error():
                 raise UncallableError("functions used for events are not callable.")
@@ -256,17 +491,11 @@ class Client:
         """
         def decorator(function: Callable):
 
-            def process():
-                while True:
-                    cache = list(self.get_club_members(tag))
-                    sleep(repeat_duration)
-                    current = list(self.get_club_members(tag))
-                    difference = _difference(cache, current)
-                    if len(difference) >= 1:
-                        function(members = difference)
+            def changes(members: list, data: dict) -> list:
+                tags = {member["tag"] for member in data["items"]}
+                return [_coloured(member) for member in members if member["tag"] not in tags]
 
-            thread = Thread(target = process)
-            thread.start()
+            self._watch(f"member_leave:{tag}", f"{BASE_URL}clubs/{tag}/members", function, "members", snapshot = lambda data: data["items"], changes = changes, repeat_duration = repeat_duration)
 
             def error():
                 raise UncallableError("functions used for events are not callable.")
@@ -284,16 +513,52 @@ class Client:
         :param repeat_duration: The time to sleep for between every check.
         :type repeat_duration: Optional[:class:`float`]
         """
+        def decorator(function: Callable):
+
+            def snapshot(data: dict) -> str:
+                return max((battle["battleTime"] for battle in data["items"]), default = "")
+
+            def changes(battle_time: str, data: dict) -> list:
+                return [_battle(battle) for battle in data["items"] if battle["battleTime"] > battle_time]
+
+            self._watch(f"battlelog:{tag}", f"{BASE_URL}players/{tag}/battlelog", function, "battles", snapshot = snapshot, changes = changes, repeat_duration = repeat_duration)
+
+            def error():
+                raise UncallableError("functions used for events are not callable.")
+
+            return error
+
+        return decorator
+
+    def on_event_rotation(self):
+        """
+        Event that is called when the event rotation changes.
+
+        .. note::
+
+            Checks are scheduled for the moment an event ends or starts, rather than at a fixed interval. With a ``shard``, only the node that owns the rotation checks it.
+        """
         def decorator(function: Callable):
 
             def process():
+                data = None
+                expires = 0.0
                 while True:
-                    cache = list(self.get_player_battlelog(tag))
-                    sleep(repeat_duration)
-                    current = list(self.get_player_battlelog(tag))
-                    difference = _difference(current, cache)
-                    if len(difference) >= 1:
-                        function(battles = difference)
+                    if self.shard and not self.shard.owns(_ROTATION_KEY):
+                        data = None
+                        sleep(self.shard.heartbeat_interval)
+                        continue
+                    if data is None or time() >= expires:
+                        try:
+                            current, expires = self._load_rotation()
+                        except (BrawlStarsException, ValueError):
+                            sleep(_ROTATION_RETRY)
+                            continue
+                        if data is not None and current != data:
+                            function(events = EventList(current))
+                        data = current
+                    wait = max(0.0, expires - time())
+                    sleep(min(wait, self.shard.heartbeat_interval) if self.shard else wait)
 
             thread = Thread(target = process)
             thread.start()
@@ -25,6 +25,8 @@ SOFTWARE.
 
 from __future__ import annotations
 
+from requests import RequestException
+
 
 class BrawlStarsException(Exception):
 
@@ -87,3 +89,12 @@ class UncallableError(BrawlStarsException):
     """
 
     pass
+
+
+class TransportError(BrawlStarsException, RequestException):
+
+    """
+    An exception that is raised when a request could not be sent or its response could not be received, whatever the transport.
+    """
+
+    pass
@@ -0,0 +1,233 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from json import dumps, loads
+from sqlite3 import Connection
+from threading import Lock, local
+from time import time
+from typing import Any, List, Optional, Tuple, Union
+from zlib import compress, decompress
+
+from .models import Player
+from .utils import _connect
+
+
+def _flatten(value: Any, path: str, flat: dict) -> dict:
+    # Lists of objects with an ID are keyed by it, and their order is kept
+    # under "#order" since keys that appear later would otherwise be put last.
+    if isinstance(value, list) and value and all(isinstance(item, dict) and "id" in item for item in value):
+        flat[f"{path}/#order"] = [item["id"] for item in value]
+        value = {f"@{item['id']}": item for item in value}
+    if isinstance(value, dict) and value:
+        for key, item in value.items():
+            _flatten(item, f"{path}/{key}" if path else str(key), flat)
+    else:
+        flat[path] = value
+    return flat
+
+
+def _restore(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    order = value.pop("#order", None)
+    if value and all(key.startswith("@") for key in value):
+        keys = [f"@{item}" for item in order] if order is not None else list(value)
+        return [_restore(value[key]) for key in keys]
+    return {key: _restore(item) for key, item in value.items()}
+
+
+def _unflatten(flat: dict) -> dict:
+    root = {}
+    for path, value in flat.items():
+        node = root
+        *parents, name = path.split("/")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+    return _restore(root)
+
+
+def _encode(value: Any) -> bytes:
+    return compress(dumps(value, separators = (",", ":")).encode())
+
+
+def _decode(value: bytes) -> Any:
+    return loads(decompress(value))
+
+
+class PlayerHistory:
+
+    """
+    A class that represents a time series store of player snapshots.
+
+    Every player gets a full keyframe, followed by deltas holding only the fields that changed, such as trophies, victories or the power and rank of a brawler. A new keyframe is written every ``keyframe_interval`` deltas so that reconstructing a snapshot never replays more than that many deltas.
+
+    Fields are addressed by their path in the API response, with brawlers keyed by their ID, e.g. ``"trophies"`` or ``"brawlers/@16000000/power"``.
+
+    :param path: The path of the database.
+    :type path: :class:`str`
+    :param keyframe_interval: The number of deltas written between two keyframes.
+    :type keyframe_interval: Optional[:class:`int`]
+    :param max_size: The maximum number of players whose latest snapshot is kept in memory to compute deltas. Others are rebuilt from the database when recorded again.
+    :type max_size: Optional[:class:`int`]
+
+    .. note::
+
+        A player should only be recorded by one process at a time, and in chronological order.
+    """
+
+    def __init__(self, path: str, *, keyframe_interval: Optional[int] = 50, max_size: Optional[int] = 1024) -> None:
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.max_size = max_size
+        self._local = local()
+        self._lock = Lock()
+        self._latest: OrderedDict[str, Tuple[dict, int, float]] = OrderedDict()
+        self._connection().execute("CREATE TABLE IF NOT EXISTS snapshots (tag TEXT, time REAL, keyframe INTEGER, data BLOB, PRIMARY KEY (tag, time))")
+
+    def _connection(self) -> Connection:
+        return _connect(self.path, self._local)
+
+    def _replay(self, tag: str, at: Optional[float] = None) -> Tuple[Optional[dict], int, float]:
+        at = float("inf") if at is None else at
+        connection = self._connection()
+        keyframe = connection.execute("SELECT time, data FROM snapshots WHERE tag = ? AND keyframe = 1 AND time <= ? ORDER BY time DESC LIMIT 1", (tag, at)).fetchone()
+        if keyframe is None:
+            return None, 0, float("-inf")
+        flat = _decode(keyframe[1])
+        latest = keyframe[0]
+        rows = connection.execute("SELECT time, data FROM snapshots WHERE tag = ? AND keyframe = 0 AND time > ? AND time <= ? ORDER BY time", (tag, keyframe[0], at)).fetchall()
+        for latest, delta in rows:
+            delta = _decode(delta)
+            flat.update(delta["s"])
+            for path in delta["d"]:
+                flat.pop(path, None)
+        return flat, len(rows), latest
+
+    def _remember(self, tag: str, flat: dict, count: int, at: float) -> None:
+        self._latest[tag] = (flat, count, at)
+        self._latest.move_to_end(tag)
+        while len(self._latest) > self.max_size:
+            self._latest.popitem(last = False)
+
+    def record(self, player: Union[Player, dict], *, at: Optional[float] = None) -> bool:
+        """
+        Records a snapshot of a player.
+
+        :param player: The player, or the raw response of :meth:`Client.get_player`.
+        :type player: Union[:class:`Player`, :class:`dict`]
+        :param at: The UNIX timestamp of the snapshot, defaults to now.
+        :type at: Optional[:class:`float`]
+
+        .. note::
+
+            Returns ``False`` if nothing changed since the last snapshot, in which case nothing is written. Raises :class:`ValueError` if ``at`` is not later than the last snapshot of the player.
+        """
+        data = player.raw() if isinstance(player, Player) else player
+        at = time() if at is None else at
+        tag = data["tag"]
+        flat = _flatten(data, "", {})
+        with self._lock:
+            latest = self._latest.get(tag)
+            previous, count, last = latest if latest else self._replay(tag)
+            if at <= last:
+                raise ValueError(f"snapshots of {tag} must be recorded after the last one, at {last}.")
+            if previous is None or count + 1 >= self.keyframe_interval:
+                self._connection().execute("INSERT INTO snapshots (tag, time, keyframe, data) VALUES (?, ?, 1, ?)", (tag, at, _encode(flat)))
+                self._remember(tag, flat, 0, at)
+                return True
+            changed = {path: value for path, value in flat.items() if path not in previous or previous[path] != value}
+            deleted = [path for path in previous if path not in flat]
+            if not changed and not deleted:
+                self._remember(tag, previous, count, last)
+                return False
+            self._connection().execute("INSERT INTO snapshots (tag, time, keyframe, data) VALUES (?, ?, 0, ?)", (tag, at, _encode({"s": changed, "d": deleted})))
+            self._remember(tag, flat, count + 1, at)
+            return True
+
+    def get(self, tag: str, *, at: Optional[float] = None) -> Optional[Player]:
+        """
+        Gets a player as it was at a point in time.
+
+        :param tag: The tag of the player.
+        :type tag: :class:`str`
+        :param at: The UNIX timestamp, defaults to now.
+        :type at: Optional[:class:`float`]
+        """
+        flat, _, _ = self._replay(tag, at)
+        return None if flat is None else Player(_unflatten(flat))
+
+    def series(self, tag: str, field: str, *, start: Optional[float] = None, end: Optional[float] = None) -> List[Tuple[float, Any]]:
+        """
+        Gets the values a field took over a range of time, as a list of ``(timestamp, value)`` pairs.
+
+        The first pair holds the value at ``start``, and every other pair a change.
+
+        :param tag: The tag of the player.
+        :type tag: :class:`str`
+        :param field: The path of the field, e.g. ``"trophies"`` or ``"brawlers/@16000000/rank"``.
+        :type field: :class:`str`
+        :param start: The UNIX timestamp to start at, defaults to the first snapshot.
+        :type start: Optional[:class:`float`]
+        :param end: The UNIX timestamp to end at, defaults to now.
+        :type end: Optional[:class:`float`]
+        """
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        connection = self._connection()
+        first = connection.execute("SELECT time FROM snapshots WHERE tag = ? AND keyframe = 1 AND time <= ? ORDER BY time DESC LIMIT 1", (tag, start)).fetchone()
+        rows = connection.execute("SELECT time, keyframe, data FROM snapshots WHERE tag = ? AND time >= ? AND time <= ? ORDER BY time", (tag, first[0] if first else start, end)).fetchall()
+        series = []
+        value = None
+        seen = False
+        for timestamp, keyframe, data in rows:
+            data = _decode(data)
+            if keyframe:
+                current = data.get(field)
+            elif field in data["s"]:
+                current = data["s"][field]
+            elif field in data["d"]:
+                current = None
+            else:
+                current = value
+            if timestamp >= start:
+                if not series and seen and timestamp > start:
+                    series.append((start, value))
+                if not series or current != value:
+                    series.append((timestamp, current))
+            value = current
+            seen = True
+        if seen and not series:
+            series.append((start, value))
+        return series
+
+    def tags(self) -> List[str]:
+        """
+        Gets the tags of every recorded player.
+        """
+        return [row[0] for row in self._connection().execute("SELECT DISTINCT tag FROM snapshots ORDER BY tag")]
@@ -0,0 +1,220 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from array import array
+from threading import Lock
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .models import BrawlStarsObject, ClubRanking, PlayerRanking
+
+
+_RANK_BITS = 16
+
+
+def _tag(tag: str) -> str:
+    tag = tag.upper()
+    return tag if tag.startswith("#") else f"#{tag}"
+
+
+def _parse(ranking: Union[PlayerRanking, ClubRanking, dict, Iterable[Union[BrawlStarsObject, dict]]]) -> Tuple[List[str], array, array]:
+    if isinstance(ranking, (PlayerRanking, ClubRanking)):
+        ranking = ranking.raw()
+    if isinstance(ranking, dict):
+        ranking = ranking["items"]
+    tags = []
+    ranks = array("l")
+    trophies = array("l")
+    for position, item in enumerate(ranking, 1):
+        item = item.raw() if isinstance(item, BrawlStarsObject) else item
+        rank = item.get("rank", position)
+        if not 0 <= rank < 1 << _RANK_BITS:
+            raise ValueError(f"the rank {rank} of {item['tag']} is out of range.")
+        tags.append(_tag(item["tag"]))
+        ranks.append(rank)
+        trophies.append(item.get("trophies", 0))
+    return tags, ranks, trophies
+
+
+class LeaderboardIndex: # pylint: disable=too-many-instance-attributes
+
+    """
+    A class that represents a reverse index from tags to their ranks on any number of leaderboards.
+
+    Every board is kept as compact arrays of tag IDs and trophies in rank order, and every tag maps to an array of the positions it holds, so that looking up every rank of a tag does not depend on the number of boards.
+
+    .. note::
+
+        Boards can be identified by any hashable key, e.g. ``"global"``, ``"fr"`` or ``("global", 16000000)`` for a brawler leaderboard.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._boards: Dict[Hashable, int] = {}
+        self._keys: List[Hashable] = []
+        self._tag_ids: Dict[str, int] = {}
+        self._tags: List[Optional[str]] = []
+        self._free_tags: List[int] = []
+        self._free_boards: List[int] = []
+        self._rows: List[array] = []
+        self._ranks: List[array] = []
+        self._trophies: List[array] = []
+        self._positions: Dict[int, array] = {}
+
+    def _tag_id(self, tag: str) -> int:
+        # Must be called with the lock held.
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            if self._free_tags:
+                tag_id = self._free_tags.pop()
+                self._tags[tag_id] = tag
+            else:
+                tag_id = len(self._tags)
+                self._tags.append(tag)
+            self._tag_ids[tag] = tag_id
+        return tag_id
+
+    def ingest(self, board: Hashable, ranking: Union[PlayerRanking, ClubRanking, dict, Iterable[Union[BrawlStarsObject, dict]]]) -> None:
+        """
+        Replaces a board with a new snapshot of its ranking.
+
+        :param board: The key of the board.
+        :type board: Hashable
+        :param ranking: The ranking, as returned by :meth:`Client.get_player_rankings`, :meth:`Client.get_club_rankings`, :meth:`Client.get_brawler_rankings` or their ``iter_*`` counterparts.
+        :type ranking: Union[:class:`PlayerRanking`, :class:`ClubRanking`, Iterable[:class:`BrawlStarsObject`]]
+
+        .. note::
+
+            Ranks are taken from the ``rank`` field of every item, so a board can be a page that does not start at the top. Ranks must be below 65536, or a :class:`ValueError` is raised.
+        """
+        tags, ranks, trophies = _parse(ranking)
+        with self._lock:
+            rows = array("l", (self._tag_id(tag) for tag in tags))
+            index = self._boards.get(board)
+            if index is None:
+                index = self._board_index(board)
+            previous = dict(zip(self._rows[index], self._ranks[index]))
+            current = dict(zip(rows, ranks))
+            emptied = []
+            for tag_id, rank in previous.items():
+                if current.get(tag_id) != rank:
+                    positions = self._positions[tag_id]
+                    positions.remove(index << _RANK_BITS | rank)
+                    if not positions:
+                        del self._positions[tag_id]
+                        emptied.append(tag_id)
+            for tag_id, rank in current.items():
+                if previous.get(tag_id) != rank:
+                    self._positions.setdefault(tag_id, array("l")).append(index << _RANK_BITS | rank)
+            # Tags that are no longer on any board, and empty boards, free
+            # their IDs for new ones so that the index does not grow forever.
+            self._release(emptied)
+            self._rows[index] = rows
+            self._ranks[index] = ranks
+            self._trophies[index] = trophies
+            if not rows:
+                del self._boards[board]
+                self._keys[index] = None
+                self._free_boards.append(index)
+
+    def _release(self, tag_ids: List[int]) -> None:
+        # Must be called with the lock held.
+        for tag_id in tag_ids:
+            if tag_id not in self._positions:
+                del self._tag_ids[self._tags[tag_id]]
+                self._tags[tag_id] = None
+                self._free_tags.append(tag_id)
+
+    def _board_index(self, board: Hashable) -> int:
+        # Must be called with the lock held.
+        if self._free_boards:
+            index = self._free_boards.pop()
+            self._keys[index] = board
+        else:
+            index = len(self._keys)
+            self._keys.append(board)
+            self._rows.append(array("l"))
+            self._ranks.append(array("l"))
+            self._trophies.append(array("l"))
+        self._boards[board] = index
+        return index
+
+    def remove(self, board: Hashable) -> None:
+        """
+        Removes a board from the index.
+
+        :param board: The key of the board.
+        :type board: Hashable
+        """
+        self.ingest(board, [])
+
+    def get_ranks(self, tag: str) -> Dict[Hashable, int]:
+        """
+        Gets the rank of a player or club on every board it appears on.
+
+        :param tag: The tag of the player or club.
+        :type tag: :class:`str`
+        """
+        mask = (1 << _RANK_BITS) - 1
+        with self._lock:
+            tag_id = self._tag_ids.get(_tag(tag))
+            positions = self._positions.get(tag_id, ())
+            return {self._keys[position >> _RANK_BITS]: position & mask for position in positions}
+
+    def get_rank(self, board: Hashable, tag: str) -> Optional[int]:
+        """
+        Gets the rank of a player or club on a board.
+
+        :param board: The key of the board.
+        :type board: Hashable
+        :param tag: The tag of the player or club.
+        :type tag: :class:`str`
+        """
+        return self.get_ranks(tag).get(board)
+
+    def get_top(self, board: Hashable, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Gets the ``(tag, trophies)`` pairs at the top of a board.
+
+        :param board: The key of the board.
+        :type board: Hashable
+        :param limit: The maximum number of pairs to be returned.
+        :type limit: Optional[:class:`int`]
+        """
+        with self._lock:
+            index = self._boards.get(board)
+            if index is None:
+                return []
+            order = sorted(range(len(self._rows[index])), key = self._ranks[index].__getitem__)
+            return [(self._tags[self._rows[index][position]], self._trophies[index][position]) for position in order[:limit]]
+
+    @property
+    def boards(self) -> List[Hashable]:
+        """
+        The keys of every board that is not empty.
+        """
+        with self._lock:
+            return [key for key, rows in zip(self._keys, self._rows) if rows]
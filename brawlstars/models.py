@@ -27,10 +27,63 @@ from __future__ import annotations
 
 from datetime import datetime
 from re import sub
-from typing import Iterator, Union
+from time import time
+from typing import Iterator, Optional, Union
 
 
-class BrawlStarsObject:
+_SNAKE_CASE = {}
+
+
+def _snake_case(key: str) -> str:
+    # Payloads repeat the same few keys many times, so conversions are cached.
+    _key = _SNAKE_CASE.get(key)
+    if _key is None:
+        _key = _SNAKE_CASE[key] = type(key)(sub(r"(?<!^)(?=[A-Z])", "_", str(key)).lower())
+    return _key
+
+
+def _convert(value: object) -> object:
+    if isinstance(value, dict):
+        return BrawlStarsObject(value)
+    if isinstance(value, (list, tuple)):
+        return [_convert(item) for item in value]
+    return value
+
+
+class _Model:
+
+    @property
+    def fetched_age(self) -> Optional[float]:
+        """
+        The number of seconds since the data was fetched, if it was served by a :class:`Cache`.
+        """
+        fetched_at = getattr(self._data, "fetched_at", None)
+        return None if fetched_at is None else time() - fetched_at
+
+    def raw(self) -> Union[dict, list]:
+        """
+        Returns the payload that the model was built from.
+        """
+        return self._data
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self._data,)
+
+
+def _battle(item: dict) -> BrawlStarsObject:
+    battle = BrawlStarsObject(item)
+    battle.battle_time = datetime.strptime(item["battleTime"], "%Y%m%dT%H%M%S.%fZ")
+    return battle
+
+
+def _coloured(item: dict) -> BrawlStarsObject:
+    # Members and ranked players carry their name colour as a hex string.
+    player = BrawlStarsObject(item)
+    player.name_color = hex(int(item["nameColor"], 16))
+    return player
+
+
+class BrawlStarsObject(_Model):
 
     """
     A class that represents a custom object for the library.
@@ -40,26 +93,21 @@ class BrawlStarsObject:
         self._data = _data
         if isinstance(self._data, dict):
             for key, value in self._data.items():
-                _key = type(key)(sub(r"(?<!^)(?=[A-Z])", "_", str(key)).lower())
-                if isinstance(value, (list, tuple)):
-                    self.__setattr__(_key, [BrawlStarsObject(index) if isinstance(index, (dict, list, tuple)) else index for index in value])
-                elif isinstance(value, dict):
-                    self.__setattr__(_key, BrawlStarsObject(value))
-                else:
-                    self.__setattr__(_key, value)
+                _key = _snake_case(key)
+                self.__setattr__(_key, _convert(value))
         else:
             self.__getitem__ = lambda index: [BrawlStarsObject(index) if isinstance(index, (dict, list, tuple)) else index for index in value][index]
 
     def __eq__(self, __o: object) -> bool:
-        for attribute in dir(self):
+        for attribute, value in vars(self).items():
             if attribute.startswith("_"):
                 continue
-            if getattr(self, attribute, None) != getattr(__o, attribute, None):
+            if value != getattr(__o, attribute, None):
                 return False
         return True
 
 
-class Battlelog:
+class Battlelog(_Model):
 
     """
     A class that represents a player's battlelog.
@@ -69,38 +117,35 @@ class Battlelog:
         self._data = _data
 
     def __getitem__(self, index: int) -> BrawlStarsObject:
-        item = self._data["items"][index]
-        battle = BrawlStarsObject(item)
-        battle.battle_time = datetime.strptime(item.pop("battleTime"), "%Y%m%dT%H%M%S.%fZ")
-        return battle
+        return _battle(self._data["items"][index])
 
     def __iter__(self) -> Iterator:
         for index in range(len(self)):
             yield self[index]
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self._data["items"])
 
     def __eq__(self, __o: object) -> bool:
         return list(self) == list(__o)
 
 
-class Player:
+class Player(_Model):
 
     """
     A class that represents a player.
     """
 
     def __init__(self, _data: dict) -> None:
+        self.__dict__.update(BrawlStarsObject({key: value for key, value in _data.items() if key != "3vs3Victories"}).__dict__)
         self._data = _data
-        self.team_victories = self._data.pop("3vs3Victories")
-        self.__dict__.update(BrawlStarsObject(self._data).__dict__)
+        self.team_victories = self._data["3vs3Victories"]
 
     def __eq__(self, __o: object) -> bool:
         return self.tag == __o.tag
 
 
-class ClubMemberList:
+class ClubMemberList(_Model):
 
     """
     A class that represents a list of club members.
@@ -110,23 +155,20 @@ class ClubMemberList:
         self._data = _data
 
     def __getitem__(self, index: int) -> BrawlStarsObject:
-        item = self._data["items"][index]
-        member = BrawlStarsObject(item)
-        member.name_color = hex(int(item.pop("nameColor"), 16))
-        return member
+        return _coloured(self._data["items"][index])
 
     def __iter__(self) -> Iterator:
         for index in range(len(self)):
             yield self[index]
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self._data["items"])
 
     def __eq__(self, __o: object) -> bool:
         return list(self) == list(__o)
 
 
-class PlayerRanking:
+class PlayerRanking(_Model):
 
     """
     A class that represents a player's rank.
@@ -136,13 +178,10 @@ class PlayerRanking:
         self._data = _data
 
     def __getitem__(self, index: int) -> BrawlStarsObject:
-        item = self._data["items"][index]
-        player = BrawlStarsObject(item)
-        player.name_color = hex(int(item.pop("nameColor"), 16))
-        return player
+        return _coloured(self._data["items"][index])
 
 
-class ClubRanking:
+class ClubRanking(_Model):
 
     """
     A class that represents a club's rank.
@@ -155,7 +194,7 @@ class ClubRanking:
         return BrawlStarsObject(self._data["items"][index])
 
 
-class EventList:
+class EventList(_Model):
 
     """
     A class that represents a list of events.
@@ -167,5 +206,5 @@ class EventList:
     def __getitem__(self, index: int) -> BrawlStarsObject:
         item = self._data[index]
         event = BrawlStarsObject(item)
-        event.start_time, event.end_time = datetime.strptime(item.pop("startTime"), "%Y%m%dT%H%M%S.%fZ"), datetime.strptime(item.pop("endTime"), "%Y%m%dT%H%M%S.%fZ")
+        event.start_time, event.end_time = datetime.strptime(item["startTime"], "%Y%m%dT%H%M%S.%fZ"), datetime.strptime(item["endTime"], "%Y%m%dT%H%M%S.%fZ")
         return event
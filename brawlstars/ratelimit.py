@@ -0,0 +1,200 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from collections import deque
+from enum import IntEnum
+from hashlib import sha256
+from os.path import join
+from sqlite3 import Connection
+from tempfile import gettempdir
+from threading import Condition, local
+from time import monotonic, time
+from typing import Optional, Union
+
+from .utils import _connect
+
+
+class Priority(IntEnum):
+
+    """
+    An enumeration of the priority lanes a request can be sent in.
+    """
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+class RateLimiter: # pylint: disable=too-many-instance-attributes
+
+    """
+    A class that represents a token bucket shared by requests of different priorities.
+
+    Waiting requests are served from the highest priority lane first, while bulk requests are guaranteed a share of the budget so that they are never starved.
+
+    :param rate: The number of requests allowed every ``per`` seconds.
+    :type rate: :class:`float`
+    :param per: The length of the window, in seconds.
+    :type per: Optional[:class:`float`]
+    :param burst: The maximum number of requests that can be sent at once, defaults to ``rate``.
+    :type burst: Optional[:class:`float`]
+    :param bulk_share: The fraction of the budget reserved for bulk requests while they are waiting.
+    :type bulk_share: Optional[:class:`float`]
+    """
+
+    def __init__(self, rate: float, per: Optional[float] = 1.0, *, burst: Optional[float] = None, bulk_share: Optional[float] = 0.1) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError("'rate' and 'per' must be positive.")
+        if not 0 <= bulk_share < 1:
+            raise ValueError("'bulk_share' must be at least 0 and less than 1.")
+        self.rate = rate
+        self.per = per
+        self.burst = burst if burst else rate
+        self.bulk_share = bulk_share
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._credit = 0.0
+        self._queues = {priority: deque() for priority in Priority}
+        self._condition = Condition()
+
+    def _take(self) -> float:
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) * self.per / self.rate
+
+    def _lane(self) -> Optional[Priority]:
+        if self._queues[Priority.BULK] and self._credit >= 1:
+            return Priority.BULK
+        for priority in Priority:
+            if self._queues[priority]:
+                return priority
+        return None
+
+    def _grant(self, priority: Priority) -> None:
+        if priority is Priority.BULK:
+            self._credit = max(0.0, self._credit - 1)
+        elif len(self._queues[Priority.BULK]) >= 1:
+            self._credit += self.bulk_share / (1 - self.bulk_share)
+        else:
+            self._credit = 0.0
+
+    def acquire(self, priority: Optional[Union[Priority, int]] = Priority.NORMAL, *, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until a request can be sent in the given lane.
+
+        :param priority: The lane of the request.
+        :type priority: Optional[:class:`Priority`]
+        :param timeout: The maximum time to wait for, in seconds.
+        :type timeout: Optional[:class:`float`]
+
+        .. note::
+
+            Returns ``False`` if the request could not be sent before ``timeout`` elapsed, and ``True`` otherwise.
+        """
+        priority = Priority(priority)
+        deadline = None if timeout is None else monotonic() + timeout
+        ticket = object()
+        with self._condition:
+            queue = self._queues[priority]
+            queue.append(ticket)
+            try:
+                while True:
+                    delay = None
+                    if self._lane() is priority and queue[0] is ticket:
+                        delay = self._take()
+                        if delay == 0:
+                            self._grant(priority)
+                            return True
+                    if deadline is not None:
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            return False
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._condition.wait(delay)
+            finally:
+                queue.remove(ticket)
+                self._condition.notify_all()
+
+
+class SharedRateLimiter(RateLimiter):
+
+    """
+    A class that represents a rate limiter whose budget is shared by every process on the host using the same ``key``.
+
+    The budget is kept in a SQLite database, and every request takes from it in a single transaction. Priority lanes work as in :class:`RateLimiter`, within each process.
+
+    :param rate: The number of requests allowed every ``per`` seconds, across all processes.
+    :type rate: :class:`float`
+    :param per: The length of the window, in seconds.
+    :type per: Optional[:class:`float`]
+    :param key: The name of the budget, usually the API token. Limiters with the same key share one budget.
+    :type key: :class:`str`
+    :param path: The path of the database, defaults to a file in the temporary directory.
+    :type path: Optional[:class:`str`]
+    :param burst: The maximum number of requests that can be sent at once, defaults to ``rate``.
+    :type burst: Optional[:class:`float`]
+    :param bulk_share: The fraction of the budget reserved for bulk requests while they are waiting.
+    :type bulk_share: Optional[:class:`float`]
+
+    .. note::
+
+        Every process sharing a budget should use the same ``rate``, ``per`` and ``burst``.
+    """
+
+    def __init__(self, rate: float, per: Optional[float] = 1.0, *, key: str, path: Optional[str] = None, burst: Optional[float] = None, bulk_share: Optional[float] = 0.1) -> None:
+        super().__init__(rate, per, burst = burst, bulk_share = bulk_share)
+        self.path = path if path else join(gettempdir(), "brawlstars-ratelimit.sqlite3")
+        self._key = sha256(key.encode()).hexdigest()
+        self._local = local()
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+    def _connection(self) -> Connection:
+        return _connect(self.path, self._local, synchronous = "OFF")
+
+    def _take(self) -> float:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (self._key,)).fetchone()
+            now = time()
+            tokens = self.burst if row is None else min(self.burst, row[0] + max(0.0, now - row[1]) * self.rate / self.per)
+            delay = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                delay = (1 - tokens) * self.per / self.rate
+            connection.execute("INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)", (self._key, tokens, now))
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return delay
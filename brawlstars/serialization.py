@@ -0,0 +1,245 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from struct import pack, unpack_from
+from typing import Any, Tuple
+
+from .cache import CachedDict, CachedList, _stamp
+from .models import Battlelog, BrawlStarsObject, ClubMemberList, ClubRanking, EventList, Player, PlayerRanking
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+_MODEL = 1
+_CACHED = 2
+
+_MODELS = {model.__name__: model for model in (Battlelog, BrawlStarsObject, ClubMemberList, ClubRanking, EventList, Player, PlayerRanking)}
+
+
+def _extension(value: Any) -> Tuple[int, Any]:
+    if isinstance(value, (CachedDict, CachedList)):
+        return _CACHED, [value.fetched_at, dict(value) if isinstance(value, dict) else list(value)]
+    if _MODELS.get(type(value).__name__) is type(value):
+        return _MODEL, [type(value).__name__, value.raw()]
+    raise TypeError(f"objects of type '{type(value).__name__}' cannot be serialised.")
+
+
+def _restore(code: int, value: Any) -> Any:
+    if code == _CACHED:
+        return _stamp(value[1], value[0])
+    if code == _MODEL:
+        return _MODELS[value[0]](value[1])
+    raise ValueError(f"unknown extension type {code}.")
+
+
+def _header(out: bytearray, length: int, small: int, small_limit: int, codes: Tuple[int, int, int]) -> None:
+    if length < small_limit:
+        out.append(small | length)
+    elif length < 0x100 and codes[0]:
+        out += pack(">BB", codes[0], length)
+    elif length < 0x10000:
+        out += pack(">BH", codes[1], length)
+    else:
+        out += pack(">BI", codes[2], length)
+
+
+def _pack_none(_: None, out: bytearray) -> None:
+    out.append(0xc0)
+
+
+def _pack_bool(value: bool, out: bytearray) -> None:
+    out.append(0xc3 if value else 0xc2)
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80 or -0x20 <= value < 0:
+        out += pack(">b" if value < 0 else ">B", value)
+        return
+    for code, form, low, high in _INTEGERS:
+        if low <= value < high:
+            out += pack(form, code, value)
+            return
+    raise OverflowError("integer is too large to be serialised.")
+
+
+def _pack_float(value: float, out: bytearray) -> None:
+    out += pack(">Bd", 0xcb, value)
+
+
+def _pack_str(value: str, out: bytearray) -> None:
+    encoded = value.encode()
+    _header(out, len(encoded), 0xa0, 32, (0xd9, 0xda, 0xdb))
+    out += encoded
+
+
+def _pack_bin(value: bytes, out: bytearray) -> None:
+    _header(out, len(value), 0, 0, (0xc4, 0xc5, 0xc6))
+    out += value
+
+
+def _pack_array(value: list, out: bytearray) -> None:
+    _header(out, len(value), 0x90, 16, (0, 0xdc, 0xdd))
+    for item in value:
+        _pack(item, out)
+
+
+def _pack_map(value: dict, out: bytearray) -> None:
+    _header(out, len(value), 0x80, 16, (0, 0xde, 0xdf))
+    for key, item in value.items():
+        _pack(key, out)
+        _pack(item, out)
+
+
+def _pack_extension(value: Any, out: bytearray) -> None:
+    code, inner = _extension(value)
+    data = bytearray()
+    _pack(inner, data)
+    _header(out, len(data), 0, 0, (0xc7, 0xc8, 0xc9))
+    out.append(code)
+    out += data
+
+
+_INTEGERS = (
+    (0xcc, ">BB", 0, 1 << 8), (0xcd, ">BH", 0, 1 << 16), (0xce, ">BI", 0, 1 << 32), (0xcf, ">BQ", 0, 1 << 64),
+    (0xd0, ">Bb", -(1 << 7), 0), (0xd1, ">Bh", -(1 << 15), 0), (0xd2, ">Bi", -(1 << 31), 0), (0xd3, ">Bq", -(1 << 63), 0),
+)
+
+_PACKERS = {
+    type(None): _pack_none, bool: _pack_bool, int: _pack_int, float: _pack_float, str: _pack_str,
+    bytes: _pack_bin, bytearray: _pack_bin, list: _pack_array, tuple: _pack_array, dict: _pack_map,
+}
+
+
+def _pack(value: Any, out: bytearray) -> None:
+    # A pure Python implementation of the subset of MessagePack used by the
+    # library, compatible with the msgpack package. Types are matched exactly
+    # so that subclasses such as cached payloads are stored as extensions.
+    _PACKERS.get(type(value), _pack_extension)(value, out)
+
+
+_CONSTANTS = {0xc0: None, 0xc2: False, 0xc3: True}
+
+_NUMBERS = {
+    0xca: (">f", 4), 0xcb: (">d", 8),
+    0xcc: (">B", 1), 0xcd: (">H", 2), 0xce: (">I", 4), 0xcf: (">Q", 8),
+    0xd0: (">b", 1), 0xd1: (">h", 2), 0xd2: (">i", 4), 0xd3: (">q", 8),
+}
+
+_LENGTHS = {
+    0xc4: (">B", 1, "bin"), 0xc5: (">H", 2, "bin"), 0xc6: (">I", 4, "bin"),
+    0xc7: (">B", 1, "ext"), 0xc8: (">H", 2, "ext"), 0xc9: (">I", 4, "ext"),
+    0xd9: (">B", 1, "str"), 0xda: (">H", 2, "str"), 0xdb: (">I", 4, "str"),
+    0xdc: (">H", 2, "array"), 0xdd: (">I", 4, "array"),
+    0xde: (">H", 2, "map"), 0xdf: (">I", 4, "map"),
+}
+
+_FIXED = ((0x8f, "map", 0x0f), (0x9f, "array", 0x0f), (0xbf, "str", 0x1f))
+
+
+def _unpack_sized(kind: str, length: int, data: bytes, position: int) -> Tuple[Any, int]:
+    if kind == "str":
+        return data[position:position + length].decode(), position + length
+    if kind == "bin":
+        return bytes(data[position:position + length]), position + length
+    if kind == "array":
+        result = []
+        for _ in range(length):
+            item, position = _unpack(data, position)
+            result.append(item)
+        return result, position
+    if kind == "map":
+        result = {}
+        for _ in range(length):
+            key, position = _unpack(data, position)
+            result[key], position = _unpack(data, position)
+        return result, position
+    value, _ = _unpack(data, position + 1)
+    return _restore(data[position], value), position + 1 + length
+
+
+def _unpack(data: bytes, position: int) -> Tuple[Any, int]:
+    code = data[position]
+    position += 1
+    if code < 0x80 or code >= 0xe0:
+        return code if code < 0x80 else code - 0x100, position
+    for last, kind, mask in _FIXED:
+        if code <= last:
+            return _unpack_sized(kind, code & mask, data, position)
+    if code in _CONSTANTS:
+        return _CONSTANTS[code], position
+    if code in _NUMBERS:
+        form, size = _NUMBERS[code]
+        return unpack_from(form, data, position)[0], position + size
+    if 0xd4 <= code <= 0xd8:
+        return _unpack_sized("ext", 1 << (code - 0xd4), data, position)
+    if code not in _LENGTHS:
+        raise ValueError(f"invalid type code {code:#x}.")
+    form, size, kind = _LENGTHS[code]
+    return _unpack_sized(kind, unpack_from(form, data, position)[0], data, position + size)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    code, inner = _extension(value)
+    return msgpack.ExtType(code, dumps(inner))
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    return _restore(code, loads(data))
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialises a raw payload or a model to MessagePack.
+
+    Models are stored as their raw payload and rebuilt when loaded, and payloads served by a :class:`Cache` keep the time they were fetched at. The ``msgpack`` package is used if it is installed.
+
+    :param value: The value to serialise.
+    :type value: Any
+    """
+    if msgpack is not None:
+        return msgpack.packb(value, default = _default, use_bin_type = True, strict_types = True)
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialises a value serialised with :func:`dumps`.
+
+    :param data: The serialised value.
+    :type data: :class:`bytes`
+    """
+    if msgpack is not None:
+        return msgpack.unpackb(data, ext_hook = _ext_hook, raw = False, strict_map_key = False)
+    value, _ = _unpack(data, 0)
+    return value
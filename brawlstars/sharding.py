@@ -0,0 +1,274 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect, insort
+from hashlib import sha256
+from sqlite3 import Connection
+from threading import Event, Lock, Thread, local
+from time import time
+from typing import Iterable, List, Optional
+
+from .utils import _connect
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(sha256(key.encode()).digest()[:8], "big")
+
+
+class HashRing:
+
+    """
+    A class that represents a consistent hash ring, which assigns every key to one of its nodes.
+
+    When a node joins or leaves, only the keys of that node move.
+
+    :param nodes: The nodes of the ring.
+    :type nodes: Optional[Iterable[:class:`str`]]
+    :param replicas: The number of points of every node on the ring. More points spread keys more evenly.
+    :type replicas: Optional[:class:`int`]
+    """
+
+    def __init__(self, nodes: Optional[Iterable[str]] = (), *, replicas: Optional[int] = 100) -> None:
+        self.replicas = replicas
+        self._points = []
+        self._nodes = {}
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """
+        The nodes of the ring, sorted.
+        """
+        return sorted(self._nodes)
+
+    def add(self, node: str) -> None:
+        """
+        Adds a node to the ring.
+
+        :param node: The node.
+        :type node: :class:`str`
+        """
+        if node in self._nodes:
+            return
+        self._nodes[node] = [(_hash(f"{node}#{index}"), node) for index in range(self.replicas)]
+        for point in self._nodes[node]:
+            insort(self._points, point)
+
+    def remove(self, node: str) -> None:
+        """
+        Removes a node from the ring.
+
+        :param node: The node.
+        :type node: :class:`str`
+        """
+        points = set(self._nodes.pop(node, ()))
+        if points:
+            self._points = [point for point in self._points if point not in points]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Gets the node that a key is assigned to, or ``None`` if the ring is empty.
+
+        :param key: The key.
+        :type key: :class:`str`
+        """
+        if not self._points:
+            return None
+        index = bisect(self._points, (_hash(key), ""))
+        return self._points[index % len(self._points)][1]
+
+
+class ShardBackend(ABC):
+
+    """
+    A class that represents the way the nodes of a :class:`Shard` find each other.
+
+    Subclasses must implement :meth:`heartbeat`, :meth:`nodes` and :meth:`leave`.
+    """
+
+    @abstractmethod
+    def heartbeat(self, node: str, ttl: float) -> None:
+        """
+        Marks a node as alive for ``ttl`` seconds.
+
+        :param node: The node.
+        :type node: :class:`str`
+        :param ttl: The number of seconds the node is alive for.
+        :type ttl: :class:`float`
+        """
+
+    @abstractmethod
+    def nodes(self) -> List[str]:
+        """
+        Gets the nodes that are alive.
+        """
+
+    @abstractmethod
+    def leave(self, node: str) -> None:
+        """
+        Removes a node at once.
+
+        :param node: The node.
+        :type node: :class:`str`
+        """
+
+
+class LocalBackend(ShardBackend):
+
+    """
+    A class that represents a backend for nodes running in the same process, mostly useful for testing.
+    """
+
+    def __init__(self) -> None:
+        self._expiries = {}
+        self._lock = Lock()
+
+    def heartbeat(self, node: str, ttl: float) -> None:
+        with self._lock:
+            self._expiries[node] = time() + ttl
+
+    def nodes(self) -> List[str]:
+        now = time()
+        with self._lock:
+            return sorted(node for node, expires in self._expiries.items() if expires > now)
+
+    def leave(self, node: str) -> None:
+        with self._lock:
+            self._expiries.pop(node, None)
+
+
+class SQLiteBackend(ShardBackend):
+
+    """
+    A class that represents a backend keeping heartbeats in a SQLite database, for nodes running on the same host.
+
+    :param path: The path of the database.
+    :type path: :class:`str`
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = local()
+        self._connection().execute("CREATE TABLE IF NOT EXISTS nodes (node TEXT PRIMARY KEY, expires REAL)")
+
+    def _connection(self) -> Connection:
+        return _connect(self.path, self._local)
+
+    def heartbeat(self, node: str, ttl: float) -> None:
+        self._connection().execute("INSERT OR REPLACE INTO nodes (node, expires) VALUES (?, ?)", (node, time() + ttl))
+
+    def nodes(self) -> List[str]:
+        return [row[0] for row in self._connection().execute("SELECT node FROM nodes WHERE expires > ? ORDER BY node", (time(),))]
+
+    def leave(self, node: str) -> None:
+        self._connection().execute("DELETE FROM nodes WHERE node = ?", (node,))
+
+
+class Shard: # pylint: disable=too-many-instance-attributes
+
+    """
+    A class that represents one node of a group that splits event watchers between them.
+
+    Every node sends heartbeats to a shared backend and builds a :class:`HashRing` of the nodes that are alive, and only polls the watchers assigned to it. When a node joins, leaves or stops sending heartbeats, its watchers move to other nodes, which resume them from the :class:`StateStore` if the nodes share one.
+
+    :param node: The unique name of the node.
+    :type node: :class:`str`
+    :param backend: The backend shared by every node.
+    :type backend: :class:`ShardBackend`
+    :param heartbeat_interval: The number of seconds between heartbeats.
+    :type heartbeat_interval: Optional[:class:`float`]
+    :param ttl: The number of seconds without a heartbeat after which a node is considered gone.
+    :type ttl: Optional[:class:`float`]
+    :param replicas: The number of points of every node on the ring.
+    :type replicas: Optional[:class:`int`]
+
+    .. note::
+
+        Nodes notice changes at their next heartbeat, so for up to ``heartbeat_interval`` seconds after a change a watcher may be polled by two nodes or by none.
+    """
+
+    def __init__(self, node: str, backend: ShardBackend, *, heartbeat_interval: Optional[float] = 5, ttl: Optional[float] = 15, replicas: Optional[int] = 100) -> None:
+        self.node = node
+        self.backend = backend
+        self.heartbeat_interval = heartbeat_interval
+        self.ttl = ttl
+        self.replicas = replicas
+        self._ring = HashRing(replicas = replicas)
+        self._stopped = Event()
+        self.refresh()
+        self._thread = Thread(target = self._run, daemon = True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.heartbeat_interval):
+            try:
+                self.refresh()
+            except Exception: # pylint: disable=broad-except
+                continue
+
+    def refresh(self) -> None:
+        """
+        Sends a heartbeat and rebuilds the ring from the nodes that are alive.
+        """
+        self.backend.heartbeat(self.node, self.ttl)
+        nodes = set(self.backend.nodes()) | {self.node}
+        if nodes != set(self._ring.nodes):
+            self._ring = HashRing(nodes, replicas = self.replicas)
+
+    @property
+    def nodes(self) -> List[str]:
+        """
+        The nodes that were alive at the last heartbeat.
+        """
+        return self._ring.nodes
+
+    def owner(self, key: str) -> str:
+        """
+        Gets the node that a key is assigned to.
+
+        :param key: The key.
+        :type key: :class:`str`
+        """
+        return self._ring.get(key)
+
+    def owns(self, key: str) -> bool:
+        """
+        Checks whether a key is assigned to this node.
+
+        :param key: The key.
+        :type key: :class:`str`
+        """
+        return not self._stopped.is_set() and self._ring.get(key) == self.node
+
+    def close(self) -> None:
+        """
+        Stops sending heartbeats and leaves the group, so that other nodes take over at their next heartbeat.
+        """
+        self._stopped.set()
+        self.backend.leave(self.node)
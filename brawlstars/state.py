@@ -0,0 +1,83 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from json import dumps, loads
+from sqlite3 import Connection
+from threading import local
+from typing import Any, Optional
+
+from .utils import _connect
+
+
+class StateStore:
+
+    """
+    A class that represents a local store for the state of event watchers, so that it survives restarts.
+
+    The state is kept in a SQLite database, which can be shared by every process on the host.
+
+    :param path: The path of the database.
+    :type path: :class:`str`
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = local()
+        self._connection().execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _connection(self) -> Connection:
+        return _connect(self.path, self._local)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Gets the state saved under a key.
+
+        :param key: The key of the state.
+        :type key: :class:`str`
+        """
+        row = self._connection().execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return None if row is None else loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Saves a state under a key.
+
+        :param key: The key of the state.
+        :type key: :class:`str`
+        :param value: The state, which must be JSON serialisable.
+        :type value: Any
+        """
+        self._connection().execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, dumps(value, separators = (",", ":"))))
+
+    def delete(self, key: str) -> None:
+        """
+        Deletes the state saved under a key.
+
+        :param key: The key of the state.
+        :type key: :class:`str`
+        """
+        self._connection().execute("DELETE FROM state WHERE key = ?", (key,))
@@ -0,0 +1,180 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from threading import local
+from typing import Iterator, Optional, Union
+
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
+
+from .exceptions import TransportError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class Transport(ABC):
+
+    """
+    A class that represents the way requests are sent to the API.
+
+    Subclasses must implement :meth:`get`, which returns a response with a ``status_code`` attribute and ``json()``, ``iter_content(chunk_size)`` and ``close()`` methods, like a :class:`requests.Response`, and raises :class:`TransportError` when the request fails.
+    """
+
+    @abstractmethod
+    def get(self, url: str, *, headers: dict, params: Optional[dict] = None, stream: Optional[bool] = False):
+        """
+        Sends a GET request.
+
+        :param url: The URL to request.
+        :type url: :class:`str`
+        :param headers: The headers to send.
+        :type headers: :class:`dict`
+        :param params: The query parameters to send.
+        :type params: Optional[:class:`dict`]
+        :param stream: Whether the body should be read lazily.
+        :type stream: Optional[:class:`bool`]
+        """
+
+    def close(self) -> None:
+        """
+        Closes every connection opened by the transport.
+        """
+
+
+class RequestsTransport(Transport):
+
+    """
+    A class that represents a transport using HTTP/1.1 through :mod:`requests`.
+
+    Unless a ``session`` is provided, every thread gets its own session, and all of them share one connection pool.
+
+    :param session: The session to use, shared by every thread.
+    :type session: Optional[:class:`requests.Session`]
+    :param headers: The default headers of the sessions.
+    :type headers: Optional[:class:`dict`]
+    :param pool_size: The maximum number of connections kept open to the API.
+    :type pool_size: Optional[:class:`int`]
+    """
+
+    def __init__(self, *, session: Optional[Session] = None, headers: Optional[dict] = None, pool_size: Optional[int] = 10) -> None:
+        self.headers = headers if headers else {}
+        self._adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = pool_size)
+        self._local = local()
+        self._session = None
+        if session:
+            self.session = session
+
+    @property
+    def session(self) -> Session:
+        """
+        The session used by the current thread.
+        """
+        if self._session:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = Session()
+            session.mount("https://", self._adapter)
+            session.headers = dict(self.headers)
+            self._local.session = session
+        return session
+
+    @session.setter
+    def session(self, session: Session) -> None:
+        session.headers = dict(self.headers)
+        self._session = session
+
+    def get(self, url: str, *, headers: dict, params: Optional[dict] = None, stream: Optional[bool] = False):
+        try:
+            return self.session.get(url, headers = headers, params = params, stream = stream)
+        except RequestException as error:
+            raise TransportError(str(error)) from error
+
+    def close(self) -> None:
+        if self._session:
+            self._session.close()
+        self._adapter.close()
+
+
+class _HTTPXResponse:
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self.status_code = response.status_code
+
+    def json(self) -> Union[dict, list]:
+        try:
+            return self._response.json()
+        except httpx.TransportError as error:
+            raise TransportError(str(error)) from error
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TransportError as error:
+            raise TransportError(str(error)) from error
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HTTP2Transport(Transport):
+
+    """
+    A class that represents a transport using HTTP/2 through :mod:`httpx`, so that concurrent requests share a few multiplexed connections.
+
+    Requires ``httpx[http2]``, which can be installed with ``pip install "brawlstars.py[http2]"``.
+
+    :param max_connections: The maximum number of connections kept open to the API.
+    :type max_connections: Optional[:class:`int`]
+    :param timeout: The timeout of every request, in seconds.
+    :type timeout: Optional[:class:`float`]
+
+    .. note::
+
+        Any other keyword argument is passed to :class:`httpx.Client`.
+    """
+
+    def __init__(self, *, max_connections: Optional[int] = 4, timeout: Optional[float] = 30, **kwargs) -> None:
+        if httpx is None:
+            raise ImportError("HTTP2Transport requires httpx, install it with 'pip install \"brawlstars.py[http2]\"'.")
+        self.client = httpx.Client(http2 = True, limits = httpx.Limits(max_connections = max_connections), timeout = timeout, **kwargs)
+
+    def get(self, url: str, *, headers: dict, params: Optional[dict] = None, stream: Optional[bool] = False):
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        request = self.client.build_request("GET", url, headers = headers, params = params)
+        try:
+            return _HTTPXResponse(self.client.send(request, stream = stream))
+        except httpx.TransportError as error:
+            raise TransportError(str(error)) from error
+
+    def close(self) -> None:
+        self.client.close()
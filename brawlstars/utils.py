@@ -25,7 +25,14 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Union, TYPE_CHECKING
+from codecs import getincrementaldecoder
+from datetime import datetime, timezone
+from json import JSONDecodeError, JSONDecoder
+from re import compile as compile_regex
+from sqlite3 import Connection, OperationalError, connect
+from threading import local
+from time import monotonic, sleep
+from typing import Iterable, Iterator, Optional, Union, TYPE_CHECKING
 from urllib.parse import quote
 
 from .exceptions import ForbiddenError, RateLimitError, UnknownError, MaintenanceError, ResourceNotFoundError
@@ -34,8 +41,17 @@ if TYPE_CHECKING:
     from .client import Client
 
 
-def _fetch(url: str, client: Client, params: dict = None) -> Union[list, dict]:
-    response = client.session.get(f"https://{quote(url)}", headers = client.session.headers, params = params)
+_DECODER = JSONDecoder()
+_WHITESPACE = compile_regex(r"[ \t\n\r]*")
+_NUMBER = "0123456789.eE+-"
+
+
+def _request(url: str, client: Client, params: dict = None, *, stream: bool = False):
+    if client.rate_limiter:
+        client.rate_limiter.acquire(client.current_priority)
+    response = client.transport.get(f"https://{quote(url)}", headers = client.headers, params = params, stream = stream)
+    if response.status_code >= 400 and stream:
+        response.close()
     if response.status_code == 400:
         raise ValueError("the request was malformed, e.g. a required parameter was missing or had an invalid value.")
     if response.status_code == 403:
@@ -48,12 +64,126 @@ def _fetch(url: str, client: Client, params: dict = None) -> Union[list, dict]:
         raise UnknownError("the cause of this error is unknown.")
     if response.status_code == 503:
         raise MaintenanceError("service is temprorarily unavailable because of maintenance.")
-    return response.json()
+    return response
+
+
+def _fetch(url: str, client: Client, params: dict = None) -> Union[list, dict]:
+    if client.cache is None:
+        return _request(url, client, params).json()
+    key = (url, tuple(sorted((key, value) for key, value in (params or {}).items() if value is not None)))
+    return client.cache.get(key, lambda: _request(url, client, params).json())
+
+
+class _JSONStream:
+
+    # Parses a JSON object as its chunks arrive, so that the elements of its
+    # "items" array can be handed out before the whole body is received.
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = iter(chunks)
+        self.decoder = getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.done = False
+
+    def read(self) -> bool:
+        if self.done:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.done = True
+            text = self.decoder.decode(b"", final = True)
+        else:
+            text = self.decoder.decode(chunk)
+        self.buffer, self.position = self.buffer[self.position:] + text, 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read():
+                raise ValueError("the response ended unexpectedly.")
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ValueError(f"expected '{character}' in the response.")
+        self.position += 1
+
+    def value(self) -> object:
+        while True:
+            self.peek()
+            try:
+                result, end = _DECODER.raw_decode(self.buffer, self.position)
+            except JSONDecodeError:
+                if not self.read():
+                    raise
+                continue
+            # A number may continue in the next chunk, e.g. "1." followed by "5".
+            tail = self.buffer[end:]
+            if (not tail or isinstance(result, (int, float)) and not tail.strip(_NUMBER)) and self.read():
+                continue
+            self.position = end
+            return result
+
+    def elements(self, closing: str) -> Iterator[None]:
+        while True:
+            character = self.peek()
+            if character == closing:
+                self.position += 1
+                return
+            if character == ",":
+                self.position += 1
+                continue
+            yield
+
+    def items(self, rest: dict) -> Iterator[dict]:
+        self.expect("{")
+        for _ in self.elements("}"):
+            key = self.value()
+            self.expect(":")
+            if key != "items" or self.peek() != "[":
+                rest[key] = self.value()
+                continue
+            self.expect("[")
+            for _ in self.elements("]"):
+                yield self.value()
+
+
+def _iter_items(chunks: Iterable[bytes], rest: dict) -> Iterator[dict]:
+    return _JSONStream(chunks).items(rest)
+
+
+def _connect(path: str, threads: local, *, synchronous: str = "NORMAL") -> Connection:
+    # SQLite connections cannot be shared between threads, so every thread
+    # opens its own and keeps it in ``threads``.
+    connection = getattr(threads, "connection", None)
+    if connection is None:
+        connection = connect(path, timeout = 30, isolation_level = None)
+        # Switching to WAL does not wait for other connections like the busy
+        # timeout does, so processes opening a new database at once retry it.
+        deadline = monotonic() + 30
+        while connection.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            try:
+                connection.execute("PRAGMA journal_mode = WAL")
+            except OperationalError:
+                if monotonic() >= deadline:
+                    raise
+                sleep(0.01)
+        connection.execute(f"PRAGMA synchronous = {synchronous}")
+        threads.connection = connection
+    return connection
 
 
-def _difference(list_1: list, list_2: list) -> list:
-    result = []
-    for element in list_1:
-        if element not in list_2:
-            result.append(element)
-    return result
+def _rotation_expiry(events: list, now: float) -> Optional[float]:
+    # The rotation changes when the first running event ends or the first
+    # upcoming one starts. Events that have already ended mean the API has not
+    # rotated yet, in which case ``None`` is returned.
+    boundaries = []
+    for event in events:
+        start, end = (datetime.strptime(event[key], "%Y%m%dT%H%M%S.%fZ").replace(tzinfo = timezone.utc).timestamp() for key in ("startTime", "endTime"))
+        if end <= now:
+            return None
+        boundaries.append(start if start > now else end)
+    return min(boundaries, default = None)
@@ -17,3 +17,8 @@ def on_member_join(members):
 def on_member_leave(members):
     for member in members:
         print(f"{member.name} ({member.trophies} 🏆) has left!")
+
+@client.on_event_rotation()
+def on_event_rotation(events):
+    for event in events:
+        print(f"{event.event.mode}: {event.event.map} until {event.end_time:%H:%M}")
@@ -24,5 +24,6 @@ setup(
     python_requires='>= 3.8.0',
     packages = ["brawlstars"],
     include_package_data = True,
-    install_requires = ["requests"]
+    install_requires = ["requests"],
+    extras_require = {"http2": ["httpx[http2]"], "msgpack": ["msgpack"]}
 )
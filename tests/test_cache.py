@@ -0,0 +1,107 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+from threading import Event
+from time import sleep
+from brawlstars.cache import Cache
+from brawlstars.client import Client
+from brawlstars.exceptions import MaintenanceError
+
+class Loader:
+    def __init__(self, release=None):
+        self.calls = 0
+        self.release = release
+    def __call__(self):
+        self.calls += 1
+        if self.release:
+            self.release.wait(1)
+        return {"tag": "#TAG", "3vs3Victories": self.calls}
+
+class TestCache(unittest.TestCase):
+    def test_fresh_hit(self):
+        cache = Cache(60)
+        loader = Loader()
+        first = cache.get("key", loader)
+        second = cache.get("key", loader)
+        self.assertIs(first, second)
+        self.assertEqual(loader.calls, 1)
+
+    def test_stale_served_and_refreshed_once(self):
+        cache = Cache(0, grace=60)
+        cache.get("key", Loader())
+        release = Event()
+        loader = Loader(release)
+        payloads = [cache.get("key", loader) for _ in range(5)]
+        self.assertTrue(all(payload["3vs3Victories"] == 1 for payload in payloads))
+        release.set()
+        for _ in range(100):
+            if cache.get("key", lambda: {"3vs3Victories": 0})["3vs3Victories"] != 1:
+                break
+            sleep(0.01)
+        self.assertEqual(loader.calls, 1)
+
+    def test_stale_if_error(self):
+        cache = Cache(0, grace=0)
+        cache.get("key", Loader())
+        def fail():
+            raise MaintenanceError("maintenance")
+        self.assertEqual(cache.get("key", fail)["3vs3Victories"], 1)
+        with self.assertRaises(MaintenanceError):
+            cache.get("other", fail)
+
+    def test_max_size(self):
+        cache = Cache(60, max_size=2)
+        for key in "abc":
+            cache.get(key, Loader())
+        loader = Loader()
+        cache.get("a", loader)
+        self.assertEqual(loader.calls, 1)
+
+    def test_client_models_report_age(self):
+        class Response:
+            status_code = 200
+            def json(self):
+                return {"tag": "#TAG", "3vs3Victories": 3}
+        class Session:
+            def __init__(self):
+                self.headers = {}
+                self.calls = 0
+            def get(self, *args, **kwargs):
+                self.calls += 1
+                return Response()
+        session = Session()
+        client = Client("token", session=session, cache=Cache(60))
+        first = client.get_player("#TAG")
+        second = client.get_player("#TAG")
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(second.team_victories, 3)
+        self.assertGreaterEqual(second.fetched_age, 0)
+        self.assertIsNone(Client("token", session=session).get_player("#TAG").fetched_age)
+
+if __name__ == "__main__":
+    unittest.main()
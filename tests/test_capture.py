@@ -0,0 +1,178 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from time import monotonic
+from unittest import mock
+from brawlstars import capture
+from brawlstars.capture import CaptureTransport, ReplayTransport, read_capture, replay
+from brawlstars.client import Client
+from brawlstars.exceptions import MaintenanceError, RateLimitError, ResourceNotFoundError
+from brawlstars.transport import Transport
+
+PLAYER = {"tag": "#A", "name": "A", "3vs3Victories": 1}
+MEMBERS = {"items": [{"tag": "#A", "nameColor": "0xffffffff"}], "paging": {"cursors": {}}}
+
+
+class Response:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self.data = data
+    def json(self):
+        return self.data
+    def iter_content(self, chunk_size=None):
+        body = json.dumps(self.data).encode()
+        for index in range(0, len(body), 8):
+            yield body[index:index + 8]
+    def close(self):
+        pass
+
+
+class FakeAPI(Transport):
+    def __init__(self):
+        self.throttled = True
+    def get(self, url, *, headers, params=None, stream=False):
+        if "/rankings/" in url:
+            return Response(503)
+        if url.endswith("/battlelog"):
+            return Response(400)
+        if url.endswith("%23BROKEN"):
+            return Response(200, {"tag": "#BROKEN"})
+        if url.endswith("/members"):
+            return Response(200, MEMBERS)
+        if self.throttled:
+            self.throttled = False
+            return Response(429)
+        return Response(200, PLAYER)
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traffic.bscap")
+
+    def capture(self):
+        client = Client("secret", transport=CaptureTransport(self.path, FakeAPI()))
+        with self.assertRaises(RateLimitError):
+            client.get_player("#A")
+        self.assertEqual(client.get_player("#A").name, "A")
+        self.assertEqual([member.tag for member in client.iter_club_members("#C", page_size=100)], ["#A"])
+        client.close()
+
+    def test_records(self):
+        self.capture()
+        records = list(read_capture(self.path))
+        self.assertEqual([record["status"] for record in records], [429, 200, 200])
+        self.assertEqual(records[1]["json"], PLAYER)
+        self.assertEqual(json.loads(records[2]["body"]), MEMBERS)
+        self.assertEqual(records[2]["params"], {"limit": 100})
+        self.assertLessEqual(records[0]["t"], records[1]["t"])
+        with open(self.path, "rb") as file:
+            self.assertNotIn(b"secret", file.read())
+
+    def test_replay_transport(self):
+        self.capture()
+        client = Client("token", transport=ReplayTransport(self.path, speed=None))
+        with self.assertRaises(RateLimitError):
+            client.get_player("#A")
+        self.assertEqual(client.get_player("#A").team_victories, 1)
+        self.assertEqual([member.name_color for member in client.iter_club_members("#C", page_size=100)], ["0xffffffff"])
+        with self.assertRaises(RateLimitError):
+            client.get_player("#A")
+        with self.assertRaises(ResourceNotFoundError):
+            client.get_player("#B")
+
+    def test_replay(self):
+        self.capture()
+        client = Client("token", transport=ReplayTransport(self.path, speed=None))
+        result = replay(client, self.path, speed=None)
+        self.assertEqual(result["requests"], 3)
+        self.assertEqual(result["errors"], {"RateLimitError": 1})
+
+    def test_streamed_errors_are_recorded_once(self):
+        client = Client("token", transport=CaptureTransport(self.path, FakeAPI()))
+        with self.assertRaises(MaintenanceError):
+            list(client.iter_player_rankings("global"))
+        client.close()
+        self.assertEqual([(record["status"], "body" in record) for record in read_capture(self.path)], [(503, False)])
+
+    def test_replay_builds_models_and_counts_every_error(self):
+        client = Client("token", transport=CaptureTransport(self.path, FakeAPI()))
+        for call in (lambda: client.get_player_battlelog("#A"), lambda: client.get_player("#BROKEN")):
+            try:
+                call()
+            except (ValueError, KeyError):
+                pass
+        client.close()
+        client = Client("token", transport=ReplayTransport(self.path, speed=None))
+        self.assertEqual(replay(client, self.path, speed=None)["errors"], {"ValueError": 1, "KeyError": 1})
+
+    def test_appended_sessions_carry_on(self):
+        for t in (0.0, 0.0):
+            transport = CaptureTransport(self.path, FakeAPI())
+            transport._write({"t": t, "url": "https://api.brawlstars.com/v1/players/%23A", "params": {}, "status": 200, "elapsed": 0.5, "json": PLAYER})
+            transport.close()
+        self.assertEqual([record["t"] for record in read_capture(self.path)], [0.0, 0.5])
+
+    def test_replay_bounds_pending_requests(self):
+        transport = CaptureTransport(self.path, FakeAPI())
+        for _ in range(20):
+            transport._write({"t": 0.0, "url": "https://api.brawlstars.com/v1/players/%23A", "params": {}, "status": 200, "elapsed": 0.0, "json": PLAYER})
+        transport.close()
+        read = []
+        released = threading.Event()
+
+        def records(path):
+            for record in read_capture(path):
+                read.append(record)
+                yield record
+
+        with mock.patch.object(capture, "read_capture", records), mock.patch.object(capture, "_build", lambda client, record: released.wait()):
+            worker = threading.Thread(target=lambda: read.append(replay(Client("token", transport=FakeAPI()), self.path, speed=None, concurrency=2)))
+            worker.start()
+            time.sleep(0.2)
+            self.assertEqual(len(read), 5)
+            released.set()
+            worker.join()
+        self.assertEqual(read[-1]["requests"], 20)
+
+    def test_speed(self):
+        transport = CaptureTransport(self.path, FakeAPI())
+        for t in (0.0, 0.4):
+            transport._write({"t": t, "url": "https://api.brawlstars.com/v1/players/%23A", "params": {}, "status": 200, "elapsed": 0.2, "json": PLAYER})
+        transport.close()
+        for speed, low, high in ((1.0, 0.6, 1.5), (10.0, 0.06, 0.5)):
+            client = Client("token", transport=ReplayTransport(self.path, speed=speed))
+            started = monotonic()
+            self.assertEqual(replay(client, self.path, speed=speed)["errors"], {})
+            self.assertTrue(low <= monotonic() - started < high)
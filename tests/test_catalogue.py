@@ -0,0 +1,83 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+from time import sleep
+from brawlstars.catalogue import Catalogue
+from brawlstars.models import BrawlStarsObject, Battlelog, Player
+
+BRAWLERS = [
+    {"id": 16000000, "name": "SHELLY", "starPowers": [{"id": 23000076, "name": "SHELL SHOCK"}], "gadgets": [{"id": 23000255, "name": "FAST FORWARD"}], "gears": [{"id": 62000000, "name": "SPEED"}]},
+    {"id": 16000001, "name": "COLT", "starPowers": [], "gadgets": [{"id": 23000273, "name": "SPEEDLOADER"}]},
+]
+
+class DummyClient:
+    def __init__(self):
+        self.calls = 0
+    def get_brawlers(self):
+        self.calls += 1
+        return [BrawlStarsObject(item) for item in BRAWLERS]
+
+class TestCatalogue(unittest.TestCase):
+    def setUp(self):
+        self.client = DummyClient()
+        self.catalogue = Catalogue(self.client)
+
+    def test_lookups(self):
+        self.assertEqual(self.catalogue.get_brawler_id("shelly"), 16000000)
+        self.assertEqual(self.catalogue.get_brawler_name(16000001), "COLT")
+        self.assertEqual(self.catalogue.get_brawler("Colt").id, 16000001)
+        self.assertEqual(self.catalogue.get_brawler("16000000").name, "SHELLY")
+        self.assertEqual(self.catalogue.get_gadget_brawler(23000273).name, "COLT")
+        self.assertEqual(self.catalogue.get_star_power_brawler(23000076).name, "SHELLY")
+        self.assertEqual(self.catalogue.get_gear(62000000).name, "SPEED")
+        self.assertIsNone(self.catalogue.get_brawler_id("nobody"))
+        self.assertEqual(len(self.catalogue.brawlers), 2)
+        self.assertEqual(self.client.calls, 1)
+
+    def test_background_refresh(self):
+        catalogue = Catalogue(self.client, refresh_interval=0)
+        catalogue.get_brawler_id("shelly")
+        self.assertEqual(catalogue.get_brawler_id("colt"), 16000001)
+        for _ in range(100):
+            if self.client.calls >= 2:
+                break
+            sleep(0.01)
+        self.assertGreaterEqual(self.client.calls, 2)
+
+    def test_enrich_player(self):
+        player = Player({"tag": "#TAG", "3vs3Victories": 0, "brawlers": [{"id": 16000001, "name": "COLT", "power": 9}]})
+        self.catalogue.enrich(player)
+        self.assertEqual(player.brawlers[0].info.gadgets[0].name, "SPEEDLOADER")
+
+    def test_enrich_battlelog(self):
+        battlelog = Battlelog({"items": [{"battleTime": "20250101T120000.000Z", "battle": {"teams": [[{"tag": "#A", "brawler": {"id": 16000000, "name": "SHELLY"}}]]}}]})
+        battles = self.catalogue.enrich(battlelog)
+        self.assertEqual(battles[0].battle.teams[0][0].brawler.info.name, "SHELLY")
+
+if __name__ == "__main__":
+    unittest.main()
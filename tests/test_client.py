@@ -149,5 +149,199 @@ class TestClient(unittest.TestCase):
         from brawlstars.exceptions import MaintenanceError
         self.assertTrue(isinstance(cm.exception, MaintenanceError))
 
+    def test_concurrent_use(self):
+        import json
+        from threading import Thread, Lock
+        from requests import Response
+        from requests.adapters import BaseAdapter
+        from brawlstars.ratelimit import RateLimiter
+
+        class EchoAdapter(BaseAdapter):
+            def send(self, request, **kwargs):
+                response = Response()
+                response.status_code = 200
+                response._content = json.dumps({"tag": request.url.rsplit("/", 1)[-1], "3vs3Victories": 0}).encode()
+                return response
+            def close(self):
+                pass
+
+        client = Client(self.token, rate_limiter=RateLimiter(100000))
+        client.transport._adapter = EchoAdapter()
+        sessions = []
+        errors = []
+        lock = Lock()
+
+        def work(index):
+            for _ in range(25):
+                player = client.get_player(f"TAG{index}")
+                if player.tag != f"TAG{index}":
+                    errors.append((index, player.tag))
+            with lock:
+                sessions.append(client.session)
+
+        threads = [Thread(target=work, args=(index,)) for index in range(64)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(map(id, sessions))), 64)
+
+    def test_iter_player_rankings_follows_pages(self):
+        import json
+        pages = {
+            None: {"items": [{"tag": "#A", "nameColor": "0xffffffff", "rank": 1}, {"tag": "#B", "nameColor": "0xffffffff", "rank": 2}], "paging": {"cursors": {"after": "next"}}},
+            "next": {"items": [{"tag": "#C", "nameColor": "0xffffffff", "rank": 3}], "paging": {"cursors": {}}},
+        }
+        class StreamResponse:
+            status_code = 200
+            def __init__(self, body):
+                self.body = json.dumps(body).encode()
+                self.closed = False
+            def iter_content(self, chunk_size=1):
+                for index in range(0, len(self.body), 5):
+                    yield self.body[index:index + 5]
+            def close(self):
+                self.closed = True
+        class PagingSession:
+            def __init__(self):
+                self.headers = {}
+                self.params = []
+            def get(self, *args, params=None, stream=False, **kwargs):
+                self.params.append(params)
+                return StreamResponse(pages[params["after"]])
+        session = PagingSession()
+        client = Client(self.token, session=session)
+        players = list(client.iter_player_rankings("global", page_size=2))
+        self.assertEqual([player.tag for player in players], ["#A", "#B", "#C"])
+        self.assertEqual(players[0].name_color, hex(0xffffffff))
+        self.assertEqual(session.params[1], {"after": "next", "limit": 2})
+        session.params.clear()
+        self.assertEqual(len(list(client.iter_player_rankings("global", limit=1))), 1)
+        self.assertEqual(session.params, [{"after": None, "limit": 1}])
+
+    def test_watcher_resumes_from_store(self):
+        import os, tempfile, threading
+        from brawlstars.state import StateStore
+        class Stop(Exception):
+            pass
+        class MembersResponse:
+            status_code = 200
+            def json(self):
+                return {"items": [{"tag": "#A", "nameColor": "0xffffffff"}, {"tag": "#B", "nameColor": "0xffffffff"}]}
+        class MembersSession:
+            def __init__(self):
+                self.headers = {}
+                self.calls = 0
+            def get(self, *args, **kwargs):
+                self.calls += 1
+                if self.calls > 1:
+                    raise Stop()
+                return MembersResponse()
+        with tempfile.TemporaryDirectory() as directory:
+            store = StateStore(os.path.join(directory, "state.sqlite3"))
+            store.set("member_join:#CLUB", [{"tag": "#A", "nameColor": "0xffffffff"}])
+            session = MembersSession()
+            client = Client(self.token, session=session, store=store)
+            joined = []
+            stopped = threading.Event()
+            excepthook = threading.excepthook
+            threading.excepthook = lambda args: stopped.set()
+            try:
+                client.on_member_join("#CLUB", repeat_duration=0)(lambda members: joined.extend(members))
+                self.assertTrue(stopped.wait(5))
+            finally:
+                threading.excepthook = excepthook
+            self.assertEqual([member.tag for member in joined], ["#B"])
+            self.assertEqual(session.calls, 2)
+            self.assertEqual([member["tag"] for member in store.get("member_join:#CLUB")], ["#A", "#B"])
+
+    def test_watcher_survives_errors(self):
+        import threading
+        from brawlstars.exceptions import TransportError
+        class Stop(Exception):
+            pass
+        class MembersResponse:
+            status_code = 200
+            def __init__(self, tags):
+                self.tags = tags
+            def json(self):
+                return {"items": [{"tag": tag, "nameColor": "0xffffffff"} for tag in self.tags]}
+        class FlakySession:
+            def __init__(self):
+                self.headers = {}
+                self.calls = 0
+            def get(self, *args, **kwargs):
+                self.calls += 1
+                if self.calls == 2:
+                    return make_response(503)
+                if self.calls == 3:
+                    raise TransportError("connection reset")
+                if self.calls > 4:
+                    raise Stop()
+                return MembersResponse(["#A"] if self.calls == 1 else ["#A", "#B"])
+        client = Client(self.token, session=FlakySession())
+        joined = []
+        stopped = threading.Event()
+        excepthook = threading.excepthook
+        threading.excepthook = lambda args: stopped.set()
+        try:
+            client.on_member_join("#CLUB", repeat_duration=0)(lambda members: joined.extend(members))
+            self.assertTrue(stopped.wait(5))
+        finally:
+            threading.excepthook = excepthook
+        self.assertEqual([member.tag for member in joined], ["#B"])
+
+    def test_event_rotation_is_cached_until_boundary(self):
+        import threading
+        from datetime import datetime, timedelta, timezone
+        def stamp(offset):
+            return (datetime.now(timezone.utc) + timedelta(seconds=offset)).strftime("%Y%m%dT%H%M%S.%f")[:-3] + "Z"
+        rotations = [
+            [{"startTime": stamp(-60), "endTime": stamp(0.3), "event": {"id": 1}}],
+            [{"startTime": stamp(0.3), "endTime": stamp(3600), "event": {"id": 2}}],
+        ]
+        class RotationResponse:
+            status_code = 200
+            def __init__(self, data):
+                self.data = data
+            def json(self):
+                return self.data
+        class RotationSession:
+            def __init__(self):
+                self.headers = {}
+                self.calls = 0
+            def get(self, *args, **kwargs):
+                self.calls += 1
+                return RotationResponse(rotations[min(self.calls, 2) - 1])
+        session = RotationSession()
+        client = Client(self.token, session=session)
+        self.assertEqual(client.get_event_rotation()[0].event.id, 1)
+        self.assertEqual(client.get_event_rotation()[0].event.id, 1)
+        self.assertEqual(session.calls, 1)
+        changed = threading.Event()
+        received = []
+        def on_event_rotation(events):
+            received.append(events[0].event.id)
+            changed.set()
+        from functools import partial
+        from unittest import mock
+        with mock.patch("brawlstars.client.Thread", partial(threading.Thread, daemon=True)):
+            client.on_event_rotation()(on_event_rotation)
+        self.assertTrue(changed.wait(5))
+        self.assertEqual(received, [2])
+        self.assertEqual(client.get_event_rotation()[0].event.id, 2)
+        self.assertEqual(session.calls, 2)
+
+    def test_rotation_refresh_retries_after_bad_request(self):
+        from unittest import mock
+        session = DummySession()
+        session.get = lambda *args, **kwargs: make_response(400)
+        client = Client(self.token, session=session)
+        with mock.patch("brawlstars.client.Timer") as timer:
+            client._refresh_rotation()
+        timer.assert_called_once_with(10, client._refresh_rotation)
+        timer.return_value.start.assert_called_once_with()
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from brawlstars.history import PlayerHistory
+from brawlstars.models import Player
+
+def make_player(day):
+    return {
+        "tag": "#TAG", "name": "Player", "trophies": 1000 + day, "3vs3Victories": 500 + day // 2,
+        "icon": {"id": 28000000},
+        "brawlers": [
+            {"id": 16000000 + index, "name": f"BRAWLER{index}", "power": 9 if index or day < 5 else 10, "rank": 20, "trophies": 500 + (day if index == 0 else 0),
+             "starPowers": [{"id": 23000000 + index, "name": "STAR"}], "gadgets": [], "gears": []}
+            for index in range(60)
+        ],
+    }
+
+class TestPlayerHistory(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.sqlite3")
+        self.history = PlayerHistory(self.path, keyframe_interval=4)
+        for day in range(10):
+            self.history.record(make_player(day), at=day * 86400)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_point_in_time(self):
+        for day in (0, 3, 4, 9):
+            player = self.history.get("#TAG", at=day * 86400 + 1)
+            self.assertIsInstance(player, Player)
+            self.assertEqual(player.raw(), make_player(day))
+        self.assertIsNone(self.history.get("#TAG", at=-1))
+        self.assertIsNone(self.history.get("#OTHER"))
+
+    def test_series(self):
+        self.assertEqual(self.history.series("#TAG", "brawlers/@16000000/power"), [(0, 9), (5 * 86400, 10)])
+        self.assertEqual(self.history.series("#TAG", "trophies", start=2.5 * 86400, end=4 * 86400), [(2.5 * 86400, 1002), (3 * 86400, 1003), (4 * 86400, 1004)])
+
+    def test_unchanged_snapshot_is_skipped(self):
+        self.assertFalse(self.history.record(Player(make_player(9)), at=10 * 86400))
+
+    def test_resumes_after_reopening(self):
+        history = PlayerHistory(self.path, keyframe_interval=4)
+        self.assertTrue(history.record(make_player(10), at=10 * 86400))
+        self.assertEqual(history.get("#TAG").raw(), make_player(10))
+        self.assertEqual(history.tags(), ["#TAG"])
+
+    def test_snapshots_must_be_chronological(self):
+        for at in (9 * 86400, 8 * 86400):
+            with self.assertRaises(ValueError):
+                self.history.record(make_player(20), at=at)
+        self.assertEqual(self.history.get("#TAG").raw(), make_player(9))
+        history = PlayerHistory(self.path, keyframe_interval=4)
+        with self.assertRaises(ValueError):
+            history.record(make_player(20), at=9 * 86400)
+        self.assertEqual(history.get("#TAG").raw(), make_player(9))
+
+    def test_memory_is_bounded(self):
+        history = PlayerHistory(os.path.join(self.directory.name, "bounded.sqlite3"), keyframe_interval=4, max_size=2)
+        for day in range(6):
+            for index in range(5):
+                history.record(dict(make_player(day), tag=f"#{index}"), at=day)
+            self.assertLessEqual(len(history._latest), 2)
+        for index in range(5):
+            self.assertEqual(history.get(f"#{index}").raw(), dict(make_player(5), tag=f"#{index}"))
+
+    def test_list_order_is_kept(self):
+        history = PlayerHistory(os.path.join(self.directory.name, "order.sqlite3"))
+        recorded = []
+        for at, ids in enumerate(([1, 3], [1, 2, 3], [2, 1, 3], [2, 3]), 1):
+            player = {"tag": "#TAG", "3vs3Victories": 0, "brawlers": [{"id": brawler, "power": 1} for brawler in ids]}
+            history.record(player, at=at)
+            recorded.append(player)
+        for at, player in enumerate(recorded, 1):
+            self.assertEqual(history.get("#TAG", at=at).raw(), player)
+
+    def test_storage_is_compact(self):
+        history = PlayerHistory(os.path.join(self.directory.name, "compact.sqlite3"))
+        for day in range(100):
+            history.record(make_player(day), at=day)
+        stored = sum(len(row[0]) for row in sqlite3.connect(history.path).execute("SELECT data FROM snapshots"))
+        raw = sum(len(json.dumps(make_player(day))) for day in range(100))
+        self.assertLess(stored * 10, raw)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+from brawlstars.leaderboard import LeaderboardIndex
+from brawlstars.models import PlayerRanking
+
+def page(*tags, start=1):
+    return {"items": [{"tag": tag, "nameColor": "0xffffffff", "trophies": 1001 - rank, "rank": rank} for rank, tag in enumerate(tags, start)]}
+
+class TestLeaderboardIndex(unittest.TestCase):
+    def test_ranks_across_boards(self):
+        index = LeaderboardIndex()
+        index.ingest("global", PlayerRanking(page("#A", "#B", "#C")))
+        index.ingest("fr", page("#B", "#A"))
+        index.ingest(("global", 16000000), list(PlayerRanking(page("#C", "#A"))))
+        self.assertEqual(index.get_ranks("#A"), {"global": 1, "fr": 2, ("global", 16000000): 2})
+        self.assertEqual(index.get_rank("fr", "b"), 1)
+        self.assertEqual(index.get_ranks("#Z"), {})
+        self.assertEqual(index.get_top("global", 2), [("#A", 1000), ("#B", 999)])
+
+    def test_incremental_update(self):
+        index = LeaderboardIndex()
+        index.ingest("global", page("#A", "#B", "#C"))
+        index.ingest("global", page("#B", "#A"))
+        self.assertEqual(index.get_ranks("#A"), {"global": 2})
+        self.assertEqual(index.get_ranks("#B"), {"global": 1})
+        self.assertEqual(index.get_ranks("#C"), {})
+        index.remove("global")
+        self.assertEqual(index.get_ranks("#A"), {})
+        self.assertEqual(index.boards, [])
+
+    def test_ranks_come_from_items(self):
+        index = LeaderboardIndex()
+        index.ingest("global", page("#A", "#B", start=201))
+        self.assertEqual(index.get_ranks("#A"), {"global": 201})
+        self.assertEqual(index.get_rank("global", "#B"), 202)
+        index.ingest("global", page("#B", "#A", start=201))
+        self.assertEqual(index.get_ranks("#A"), {"global": 202})
+        index.ingest("global", {"items": [{"tag": "#B", "rank": 2, "trophies": 5}, {"tag": "#A", "rank": 1, "trophies": 6}]})
+        self.assertEqual(index.get_top("global"), [("#A", 6), ("#B", 5)])
+
+    def test_memory_is_reclaimed(self):
+        index = LeaderboardIndex()
+        for snapshot in range(100):
+            index.ingest("global", page(*[f"#{snapshot}-{row}" for row in range(50)]))
+            index.ingest(("page", snapshot), page("#X"))
+            index.remove(("page", snapshot))
+        self.assertEqual(len(index._tags), 100)
+        self.assertEqual(len(index._keys), 2)
+        self.assertEqual(index.get_ranks("#99-0"), {"global": 1})
+        self.assertEqual(index.get_ranks("#0-0"), {})
+        self.assertEqual(index.boards, ["global"])
+
+    def test_rank_out_of_range(self):
+        index = LeaderboardIndex()
+        with self.assertRaises(ValueError):
+            index.ingest("global", [{"tag": "#A", "rank": 1 << 16}])
+        self.assertEqual(index.boards, [])
+
+    def test_many_boards(self):
+        index = LeaderboardIndex()
+        for board in range(300):
+            index.ingest(board, page(*[f"#{(board + row) % 1000}" for row in range(200)]))
+        ranks = index.get_ranks("#150")
+        self.assertEqual(len(ranks), 151)
+        self.assertEqual(ranks[0], 151)
+        self.assertEqual(ranks[150], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from brawlstars import __main__ as cli
+from brawlstars.exceptions import ResourceNotFoundError
+from brawlstars.models import BrawlStarsObject, Player
+
+class DummyClient:
+    def __init__(self, *args, **kwargs):
+        self.requested = []
+    def get_player(self, tag):
+        self.requested.append(tag)
+        if tag == "#MISSING":
+            raise ResourceNotFoundError("resource was not found.")
+        return Player({"tag": tag, "3vs3Victories": 1})
+    def iter_player_rankings(self, country):
+        if country == "zz":
+            raise ResourceNotFoundError("resource was not found.")
+        return iter([BrawlStarsObject({"tag": "#A", "name": "A", "rank": 1, "trophies": 100, "club": {"name": "Club"}})])
+    def close(self):
+        pass
+
+class TestExport(unittest.TestCase):
+    def test_ndjson_keeps_input_order(self):
+        output = io.StringIO()
+        tags = [f"#{index}" for index in range(50)] + ["", "#MISSING"]
+        count = cli._export(DummyClient(), "players", [f"{tag}\n" for tag in tags], output, concurrency=4)
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(count, 52)
+        self.assertEqual([row["tag"] for row in rows], tags[:50] + ["#MISSING"])
+        self.assertEqual(rows[0]["data"], {"tag": "#0", "3vs3Victories": 1})
+        self.assertEqual(rows[-1]["error"], "ResourceNotFoundError")
+
+    def test_csv_rankings(self):
+        output = io.StringIO()
+        cli._export(DummyClient(), "rankings", ["global\n", "zz\n"], output, output_format="csv")
+        self.assertEqual(output.getvalue().splitlines(), ["board,rank,tag,name,trophies,club,error", "global,1,#A,A,100,Club,", "zz,,,,,,ResourceNotFoundError"])
+
+    def test_connection_errors_are_retried(self):
+        from brawlstars.exceptions import TransportError
+        calls = []
+        class FlakyClient(DummyClient):
+            def get_player(self, tag):
+                calls.append(tag)
+                if len(calls) < 3 or tag == "#DOWN":
+                    raise TransportError("connection reset")
+                return super().get_player(tag)
+        output = io.StringIO()
+        with mock.patch.object(cli, "sleep"):
+            cli._export(FlakyClient(), "players", ["#A\n", "#DOWN\n"], output, concurrency=1, retries=2)
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(rows[0]["data"]["tag"], "#A")
+        self.assertEqual(rows[1], {"tag": "#DOWN", "error": "TransportError"})
+
+    def test_resume_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tags.txt")
+            output = os.path.join(directory, "out.ndjson")
+            checkpoint = os.path.join(directory, "checkpoint")
+            with open(source, "w") as file:
+                file.write("#A\n#B\n#C\n")
+            with open(output, "w") as file:
+                file.write('{"tag":"#A"}\n')
+            with open(checkpoint, "w") as file:
+                file.write("1")
+            with mock.patch.object(cli, "Client", DummyClient):
+                self.assertEqual(cli.main(["players", source, "-o", output, "--checkpoint", checkpoint, "-t", "token"]), 0)
+            with open(output) as file:
+                self.assertEqual([json.loads(line)["tag"] for line in file], ["#A", "#B", "#C"])
+            with open(checkpoint) as file:
+                self.assertEqual(file.read(), f"3 {os.path.getsize(output)}")
+
+    def test_rows_written_after_checkpoint_are_dropped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tags.txt")
+            output = os.path.join(directory, "out.ndjson")
+            checkpoint = os.path.join(directory, "checkpoint")
+            with open(source, "w") as file:
+                file.write("#A\n#B\n#C\n")
+            with open(output, "w") as file:
+                file.write('{"tag":"#A"}\n')
+                saved = file.tell()
+                file.write('{"tag":"#B"}\n{"tag":"#C"')
+            with open(checkpoint, "w") as file:
+                file.write(f"1 {saved}")
+            with mock.patch.object(cli, "Client", DummyClient):
+                self.assertEqual(cli.main(["players", source, "-o", output, "--checkpoint", checkpoint, "-t", "token"]), 0)
+            with open(output) as file:
+                self.assertEqual([json.loads(line)["tag"] for line in file], ["#A", "#B", "#C"])
+
+if __name__ == "__main__":
+    unittest.main()
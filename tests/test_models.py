@@ -41,6 +41,11 @@ class TestModels(unittest.TestCase):
         self.assertIsInstance(obj.lst[0], BrawlStarsObject)
         self.assertEqual(obj.lst[0].baz_qux, 3)
 
+    def test_brawlstarsobject_nested_lists(self):
+        obj = BrawlStarsObject({"teams": [[{"fooBar": 1}], [{"fooBar": 2}]]})
+        self.assertIsInstance(obj.teams[1], list)
+        self.assertEqual(obj.teams[1][0].foo_bar, 2)
+
     def test_brawlstarsobject_eq(self):
         a = BrawlStarsObject({"foo": 1, "bar": 2})
         b = BrawlStarsObject({"foo": 1, "bar": 2})
@@ -48,6 +53,13 @@ class TestModels(unittest.TestCase):
         self.assertEqual(a, b)
         self.assertNotEqual(a, c)
 
+    def test_brawlstarsobject_age_key(self):
+        obj = BrawlStarsObject({"age": 3, "fetchedAt": 1})
+        self.assertEqual(obj.age, 3)
+        self.assertIsNone(obj.fetched_age)
+        self.assertEqual(obj, BrawlStarsObject({"age": 3, "fetchedAt": 1}))
+        self.assertNotEqual(obj, BrawlStarsObject({"age": 4, "fetchedAt": 1}))
+
     def test_battlelog_len_and_datetime(self):
         dt = "20250101T120000.000Z"
         data = {"items": [{"battleTime": dt}]}
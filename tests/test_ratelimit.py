@@ -0,0 +1,122 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+from threading import Thread, Lock
+from time import sleep
+from brawlstars.ratelimit import Priority, RateLimiter, SharedRateLimiter
+
+def run_waiters(limiter, priorities):
+    order = []
+    lock = Lock()
+    def wait(priority):
+        limiter.acquire(priority)
+        with lock:
+            order.append(priority)
+    threads = []
+    for priority in priorities:
+        thread = Thread(target=wait, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        sleep(0.005)
+    for thread in threads:
+        thread.join()
+    return order
+
+def take(path, key, count):
+    limiter = SharedRateLimiter(10, 60, key=key, path=path)
+    return sum(limiter.acquire(timeout=0) for _ in range(count))
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_is_immediate(self):
+        limiter = RateLimiter(5)
+        for _ in range(5):
+            self.assertTrue(limiter.acquire(timeout=0))
+
+    def test_timeout(self):
+        limiter = RateLimiter(1, 10)
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.01))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+        with self.assertRaises(ValueError):
+            RateLimiter(1, bulk_share=1)
+
+    def test_interactive_preempts_queued_requests(self):
+        limiter = RateLimiter(1, 0.05, bulk_share=0)
+        limiter.acquire()
+        order = run_waiters(limiter, [Priority.NORMAL, Priority.NORMAL, Priority.BULK, Priority.INTERACTIVE])
+        self.assertEqual(order[0], Priority.INTERACTIVE)
+        self.assertEqual(order[-1], Priority.BULK)
+
+    def test_bulk_floor(self):
+        limiter = RateLimiter(1, 0.05, bulk_share=0.5)
+        limiter.acquire()
+        order = run_waiters(limiter, [Priority.BULK, Priority.NORMAL, Priority.NORMAL, Priority.NORMAL])
+        self.assertEqual(order[1], Priority.BULK)
+
+class TestSharedRateLimiter(unittest.TestCase):
+    def setUp(self):
+        import os, tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ratelimit.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_budget_is_shared(self):
+        first = SharedRateLimiter(5, 60, key="token", path=self.path)
+        second = SharedRateLimiter(5, 60, key="token", path=self.path)
+        granted = 0
+        for _ in range(5):
+            granted += first.acquire(timeout=0)
+            granted += second.acquire(timeout=0)
+        self.assertEqual(granted, 5)
+
+    def test_budgets_are_separate_per_key(self):
+        first = SharedRateLimiter(1, 60, key="first", path=self.path)
+        second = SharedRateLimiter(1, 60, key="second", path=self.path)
+        self.assertTrue(first.acquire(timeout=0))
+        self.assertTrue(second.acquire(timeout=0))
+        self.assertFalse(first.acquire(timeout=0))
+
+    def test_budget_is_shared_between_processes(self):
+        from multiprocessing import get_context
+        with get_context("spawn").Pool(3) as pool:
+            shared = pool.starmap(take, [(self.path, "token", 10)] * 3)
+            separate = pool.starmap(take, [(self.path, f"token-{index}", 10) for index in range(3)])
+        self.assertEqual(sum(shared), 10)
+        self.assertEqual(separate, [10, 10, 10])
+
+    def test_key_is_required(self):
+        with self.assertRaises(TypeError):
+            SharedRateLimiter(5, 60, path=self.path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import json
+import pickle
+import unittest
+from unittest import mock
+from brawlstars import serialization
+from brawlstars.cache import CachedDict, _stamp
+from brawlstars.models import Battlelog, Player
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+PAYLOAD = {
+    "tag": "#TAG", "name": "Plåyer", "trophies": 70000, "3vs3Victories": 12000, "expLevel": 250,
+    "negative": -1, "small": -100, "large": 1 << 40, "ratio": 0.5, "flag": True, "none": None,
+    "icon": {"id": 28000000}, "text": "x" * 300,
+    "brawlers": [{"id": 16000000 + index, "name": "SHELLY", "power": 11, "gadgets": []} for index in range(20)],
+}
+
+class TestSerialization(unittest.TestCase):
+    def round_trip(self, value):
+        with mock.patch.object(serialization, "msgpack", None):
+            data = serialization.dumps(value)
+            return data, serialization.loads(data)
+
+    def test_pure_python_round_trip(self):
+        data, value = self.round_trip(PAYLOAD)
+        self.assertEqual(value, PAYLOAD)
+        self.assertLess(len(data), len(json.dumps(PAYLOAD)))
+
+    def test_models(self):
+        player = Player(PAYLOAD)
+        _, value = self.round_trip(player)
+        self.assertIsInstance(value, Player)
+        self.assertEqual(value.team_victories, 12000)
+        _, value = self.round_trip([Battlelog({"items": [], "paging": {}})])
+        self.assertIsInstance(value[0], Battlelog)
+        self.assertEqual(len(value[0]), 0)
+
+    def test_cached_payload_keeps_fetch_time(self):
+        _, value = self.round_trip(_stamp(PAYLOAD, 1234.5))
+        self.assertIsInstance(value, CachedDict)
+        self.assertEqual(value.fetched_at, 1234.5)
+
+    def test_unsupported_type(self):
+        with mock.patch.object(serialization, "msgpack", None):
+            with self.assertRaises(TypeError):
+                serialization.dumps(object())
+
+    @unittest.skipUnless(msgpack, "msgpack is not installed")
+    def test_backends_are_compatible(self):
+        value = {"payload": _stamp(PAYLOAD, 1.0), "player": Player(PAYLOAD)}
+        accelerated = serialization.dumps(value)
+        with mock.patch.object(serialization, "msgpack", None):
+            pure = serialization.dumps(value)
+            restored = serialization.loads(accelerated)
+        self.assertEqual(restored["payload"].fetched_at, 1.0)
+        self.assertEqual(serialization.loads(pure)["player"].tag, "#TAG")
+        self.assertEqual(msgpack.unpackb(serialization.dumps(PAYLOAD), raw=False), PAYLOAD)
+
+    def test_pickle_stores_raw_payload_only(self):
+        player = Player(PAYLOAD)
+        restored = pickle.loads(pickle.dumps(player))
+        self.assertEqual(restored.brawlers[0].id, 16000000)
+        self.assertLess(len(pickle.dumps(player)), len(pickle.dumps(player.__dict__)))
+
+if __name__ == "__main__":
+    unittest.main()
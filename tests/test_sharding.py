@@ -0,0 +1,179 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import os
+import tempfile
+import threading
+import unittest
+from functools import partial
+from time import sleep
+from unittest import mock
+from brawlstars.client import Client
+from brawlstars.sharding import HashRing, LocalBackend, Shard, ShardBackend, SQLiteBackend
+from brawlstars.transport import Transport
+
+KEYS = [f"battlelog:#{index}" for index in range(2000)]
+
+
+class Stop(Exception):
+    pass
+
+
+class Response:
+    status_code = 200
+    def json(self):
+        return {"items": []}
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.urls = set()
+        self.stopped = False
+    def get(self, url, *, headers, params=None, stream=False):
+        if self.stopped:
+            raise Stop()
+        self.urls.add(url)
+        return Response()
+
+
+class TestHashRing(unittest.TestCase):
+    def test_balanced(self):
+        ring = HashRing(["a", "b", "c", "d"])
+        counts = {node: 0 for node in ring.nodes}
+        for key in KEYS:
+            counts[ring.get(key)] += 1
+        for count in counts.values():
+            self.assertTrue(300 < count < 700, counts)
+
+    def test_only_moved_keys_change(self):
+        ring = HashRing(["a", "b", "c"])
+        before = {key: ring.get(key) for key in KEYS}
+        ring.add("d")
+        after = {key: ring.get(key) for key in KEYS}
+        for key in KEYS:
+            self.assertIn(after[key], (before[key], "d"))
+        ring.remove("d")
+        self.assertEqual({key: ring.get(key) for key in KEYS}, before)
+
+    def test_empty(self):
+        self.assertIsNone(HashRing().get("key"))
+
+
+class TestBackends(unittest.TestCase):
+    def check(self, backend):
+        backend.heartbeat("a", 10)
+        backend.heartbeat("b", 0.05)
+        self.assertEqual(backend.nodes(), ["a", "b"])
+        sleep(0.1)
+        self.assertEqual(backend.nodes(), ["a"])
+        backend.leave("a")
+        self.assertEqual(backend.nodes(), [])
+
+    def test_backend_must_implement_every_method(self):
+        class Incomplete(ShardBackend):
+            def heartbeat(self, node, ttl):
+                pass
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_local(self):
+        self.check(LocalBackend())
+
+    def test_sqlite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.check(SQLiteBackend(os.path.join(directory, "nodes.sqlite3")))
+
+
+class TestShard(unittest.TestCase):
+    def test_every_key_has_one_owner(self):
+        backend = LocalBackend()
+        shards = [Shard(node, backend) for node in ("a", "b", "c")]
+        for shard in shards:
+            shard.refresh()
+        for key in KEYS:
+            self.assertEqual(sum(shard.owns(key) for shard in shards), 1)
+        shards[0].close()
+        for shard in shards[1:]:
+            shard.refresh()
+            self.assertEqual(shard.nodes, ["b", "c"])
+        self.assertFalse(any(shards[0].owns(key) for key in KEYS))
+        for key in KEYS:
+            self.assertEqual(sum(shard.owns(key) for shard in shards[1:]), 1)
+
+    def test_watchers_are_split(self):
+        backend = LocalBackend()
+        shards = [Shard("a", backend), Shard("b", backend)]
+        shards[0].refresh()
+        transports = [CountingTransport(), CountingTransport()]
+        clients = [Client("token", transport=transport, shard=shard) for transport, shard in zip(transports, shards)]
+        excepthook = threading.excepthook
+        threading.excepthook = lambda args: None
+        try:
+            with mock.patch("brawlstars.client.Thread", partial(threading.Thread, daemon=True)):
+                for client in clients:
+                    for index in range(20):
+                        client.on_battlelog_update(f"#{index}", repeat_duration=0.01)(lambda battles: None)
+            sleep(0.3)
+            self.assertEqual(len(transports[0].urls) + len(transports[1].urls), 20)
+            self.assertFalse(transports[0].urls & transports[1].urls)
+            self.assertTrue(transports[0].urls and transports[1].urls)
+            shards[0].close()
+            shards[1].refresh()
+            sleep(0.3)
+            self.assertEqual(len(transports[1].urls), 20)
+        finally:
+            for transport in transports:
+                transport.stopped = True
+            sleep(0.1)
+            threading.excepthook = excepthook
+
+    def test_rotation_is_polled_by_its_owner_only(self):
+        from datetime import datetime, timedelta, timezone
+        end = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y%m%dT%H%M%S.000Z")
+        class RotationResponse:
+            status_code = 200
+            def json(self):
+                return [{"startTime": "20200101T000000.000Z", "endTime": end, "event": {"id": 1}}]
+        class RotationTransport(Transport):
+            def __init__(self):
+                self.calls = 0
+            def get(self, url, *, headers, params=None, stream=False):
+                self.calls += 1
+                return RotationResponse()
+        backend = LocalBackend()
+        shards = [Shard("a", backend, heartbeat_interval=0.05), Shard("b", backend, heartbeat_interval=0.05)]
+        shards[0].refresh()
+        transports = [RotationTransport(), RotationTransport()]
+        with mock.patch("brawlstars.client.Thread", partial(threading.Thread, daemon=True)):
+            for transport, shard in zip(transports, shards):
+                Client("token", transport=transport, shard=shard).on_event_rotation()(lambda events: None)
+        sleep(0.3)
+        self.assertEqual(sorted(transport.calls for transport in transports), [0, 1])
+        owner = [shard.owns("event_rotation") for shard in shards].index(True)
+        shards[owner].close()
+        sleep(0.3)
+        self.assertEqual(transports[1 - owner].calls, 1)
@@ -0,0 +1,121 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+from brawlstars.client import Client
+from brawlstars.cache import Cache
+from brawlstars.exceptions import TransportError
+from brawlstars.transport import HTTP2Transport, RequestsTransport, Transport
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+class DummySession:
+    def __init__(self):
+        self.headers = {}
+
+class TestTransport(unittest.TestCase):
+    def test_custom_transport(self):
+        class Response:
+            status_code = 200
+            def json(self):
+                return {"id": 16000000, "name": "SHELLY"}
+        class RecordingTransport(Transport):
+            def __init__(self):
+                self.requests = []
+            def get(self, url, *, headers, params=None, stream=False):
+                self.requests.append((url, headers))
+                return Response()
+        transport = RecordingTransport()
+        client = Client("token", transport=transport)
+        self.assertEqual(client.get_brawler("16000000").name, "SHELLY")
+        self.assertEqual(transport.requests, [("https://api.brawlstars.com/v1/brawlers/16000000", {"Authorization": "Bearer token"})])
+
+    @unittest.skipUnless(httpx, "httpx is not installed")
+    def test_http2_transport(self):
+        seen = []
+        def handler(request):
+            seen.append(request.url)
+            if request.url.path.endswith("/players"):
+                return httpx.Response(200, json={"items": [{"tag": "#A", "nameColor": "0xffffffff"}], "paging": {"cursors": {}}})
+            return httpx.Response(404)
+        client = Client("token", transport=HTTP2Transport(transport=httpx.MockTransport(handler)))
+        self.assertEqual([player.tag for player in client.iter_player_rankings("global", limit=5)], ["#A"])
+        self.assertEqual(seen[0].params.get("limit"), "5")
+        self.assertNotIn("after", seen[0].params)
+        from brawlstars.exceptions import ResourceNotFoundError
+        with self.assertRaises(ResourceNotFoundError):
+            client.get_player("#TAG")
+        client.close()
+
+    def test_transport_must_implement_get(self):
+        class Incomplete(Transport):
+            pass
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_session_requires_requests_transport(self):
+        class Minimal(Transport):
+            def get(self, url, *, headers, params=None, stream=False):
+                raise NotImplementedError
+        client = Client("token", transport=Minimal())
+        with self.assertRaises(TypeError):
+            client.session
+        with self.assertRaises(TypeError):
+            client.session = DummySession()
+        with self.assertRaises(ValueError):
+            Client("token", session=DummySession(), transport=Minimal())
+        self.assertIsInstance(Client("token", session=DummySession()).transport, RequestsTransport)
+
+    def test_requests_errors_are_wrapped(self):
+        import requests
+        class FailingSession(DummySession):
+            def get(self, *args, **kwargs):
+                raise requests.ConnectionError("reset")
+        client = Client("token", session=FailingSession())
+        with self.assertRaises(TransportError):
+            client.get_player("#TAG")
+
+    @unittest.skipUnless(httpx, "httpx is not installed")
+    def test_http2_errors_fall_back_to_stale_cache(self):
+        fail = []
+        def handler(request):
+            if fail:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"tag": "#TAG", "3vs3Victories": 1})
+        client = Client("token", transport=HTTP2Transport(transport=httpx.MockTransport(handler)), cache=Cache(0, grace=0))
+        self.assertEqual(client.get_player("#TAG").team_victories, 1)
+        fail.append(True)
+        self.assertEqual(client.get_player("#TAG").team_victories, 1)
+        with self.assertRaises(TransportError):
+            client.get_player("#OTHER")
+        client.close()
+
+if __name__ == "__main__":
+    unittest.main()
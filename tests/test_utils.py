@@ -0,0 +1,92 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import json
+import os
+import tempfile
+import unittest
+from threading import Barrier, Thread, local
+from brawlstars.utils import _connect, _iter_items
+
+class TestIterItems(unittest.TestCase):
+    def parse(self, body, size):
+        rest = {}
+        chunks = [body[index:index + size] for index in range(0, len(body), size)]
+        return list(_iter_items(chunks, rest)), rest
+
+    def test_chunk_boundaries(self):
+        data = {"items": [{"tag": f"#{index}", "name": 'Bé "q"', "trophies": index * 1234567, "x": [1, 2.5, None, True]} for index in range(50)], "paging": {"cursors": {"after": "abc"}}}
+        body = json.dumps(data, ensure_ascii=False, indent=1).encode()
+        for size in (1, 3, 64, len(body)):
+            items, rest = self.parse(body, size)
+            self.assertEqual(items, data["items"])
+            self.assertEqual(rest, {"paging": data["paging"]})
+
+    def test_keys_before_items(self):
+        items, rest = self.parse(b'{"count": 123, "items": [], "paging": {}}', 2)
+        self.assertEqual(items, [])
+        self.assertEqual(rest, {"count": 123, "paging": {}})
+
+    def test_numbers_split_between_chunks(self):
+        body = b'{"items":[1.5,-2e+10,3.25E-2,42],"count":7}'
+        for size in range(1, len(body) + 1):
+            items, rest = self.parse(body, size)
+            self.assertEqual(items, [1.5, -2e+10, 3.25E-2, 42])
+            self.assertEqual(rest, {"count": 7})
+        self.assertEqual(list(_iter_items([b'{"items":[1.', b'5]}'], {})), [1.5])
+
+    def test_truncated_body(self):
+        with self.assertRaises(ValueError):
+            self.parse(b'{"items": [{"tag": "#A"}', 4)
+
+class TestConnect(unittest.TestCase):
+    def test_new_database_opened_at_once(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        errors = []
+        for index in range(50):
+            path = os.path.join(directory.name, f"{index}.db")
+            barrier = Barrier(8)
+
+            def open_database():
+                barrier.wait()
+                try:
+                    connection = _connect(path, local())
+                    self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                    connection.close()
+                except Exception as error:
+                    errors.append(error)
+
+            threads = [Thread(target=open_database) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+
+if __name__ == "__main__":
+    unittest.main()